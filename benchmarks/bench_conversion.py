@@ -0,0 +1,71 @@
+"""
+Benchmark de la construcción por subconjuntos.
+
+Compara la implementación con máscaras de bits (ConversorAFNDaAFD.convertir)
+contra la versión original basada en frozenset de nombres.
+
+Uso:
+    python benchmarks/bench_conversion.py [n]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import AFND, AFD, ConversorAFNDaAFD  # noqa: E402
+from generadores import afnd_enesimo_desde_el_final  # noqa: E402
+
+
+def convertir_con_frozenset(afnd: AFND) -> AFD:
+    """Construcción original (sin impresiones) usada como referencia"""
+    nombre = ConversorAFNDaAFD._nombre_estado
+    inicial = frozenset({afnd.estado_inicial})
+    cola = deque([inicial])
+    procesados = {inicial}
+    estados, transiciones, finales = {nombre(inicial)}, {}, set()
+    if inicial & afnd.estados_finales:
+        finales.add(nombre(inicial))
+    while cola:
+        actual = cola.popleft()
+        for simbolo in afnd.alfabeto:
+            destino = frozenset(afnd.mover(actual, simbolo))
+            transiciones[(nombre(actual), simbolo)] = nombre(destino)
+            if destino not in procesados:
+                procesados.add(destino)
+                estados.add(nombre(destino))
+                cola.append(destino)
+                if destino & afnd.estados_finales:
+                    finales.add(nombre(destino))
+    return AFD(estados, afnd.alfabeto, transiciones, nombre(inicial), finales)
+
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        resultado = funcion(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    afnd = afnd_enesimo_desde_el_final(n)
+
+    ref, t_ref = medir(convertir_con_frozenset, afnd)
+    nuevo, t_nuevo = medir(ConversorAFNDaAFD.convertir, afnd)
+
+    iguales = (ref.estados == nuevo.estados and ref.transiciones == nuevo.transiciones
+               and ref.estado_inicial == nuevo.estado_inicial
+               and ref.estados_finales == nuevo.estados_finales)
+
+    print(f"AFND: {len(afnd.estados)} estados → AFD: {len(nuevo.estados)} estados")
+    print(f"  frozenset : {t_ref:.3f} s")
+    print(f"  bitmask   : {t_nuevo:.3f} s  (x{t_ref / t_nuevo:.1f})")
+    print(f"  AFD idéntico: {'sí' if iguales else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
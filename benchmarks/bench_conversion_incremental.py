@@ -0,0 +1,102 @@
+"""
+Benchmark de la conversión incremental.
+
+Aplica una serie de ediciones aleatorias (agregar o quitar transiciones y
+cambiar finales, cada una seguida de su reversión) a un AFND y compara el tiempo de mantener el AFD con
+ConversorIncremental contra reconvertir desde cero después de cada edición
+(ambos producen la forma compilada, sin armar los nombres de estado).
+
+Uso:
+    python benchmarks/bench_conversion_incremental.py [n] [ediciones]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import AFND, ConversorAFNDaAFD  # noqa: E402
+from conversion_incremental import ConversorIncremental  # noqa: E402
+from generadores import afnd_aleatorio, afnd_enesimo_desde_el_final  # noqa: E402
+
+
+def copiar(afnd: AFND) -> AFND:
+    return AFND(set(afnd.estados), set(afnd.alfabeto),
+                {k: set(v) for k, v in afnd.transiciones.items()},
+                afnd.estado_inicial, set(afnd.estados_finales))
+
+
+def ediciones_aleatorias(afnd: AFND, cantidad: int, semilla: int = 0):
+    """
+    Pares de edición y su reversión (agregar y luego quitar una transición,
+    o cambiar un final y restaurarlo), como al ajustar a mano un autómata:
+    así el AFD conserva su tamaño durante toda la serie.
+    """
+    rng = random.Random(semilla)
+    estados = sorted(afnd.estados)
+    simbolos = sorted(afnd.alfabeto)
+    for _ in range(cantidad // 2):
+        if rng.random() < 0.8:
+            origen, simbolo, destino = (rng.choice(estados), rng.choice(simbolos),
+                                        rng.choice(estados))
+            if destino in afnd.transiciones.get((origen, simbolo), ()):
+                yield ("quitar", origen, simbolo, destino)
+                yield ("agregar", origen, simbolo, destino)
+            else:
+                yield ("agregar", origen, simbolo, destino)
+                yield ("quitar", origen, simbolo, destino)
+        else:
+            estado = rng.choice(estados)
+            es_final = estado in afnd.estados_finales
+            yield ("final", estado, not es_final)
+            yield ("final", estado, es_final)
+
+
+def aplicar(incremental: ConversorIncremental, edicion):
+    if edicion[0] == "agregar":
+        incremental.agregar_transicion(*edicion[1:])
+    elif edicion[0] == "quitar":
+        incremental.quitar_transicion(*edicion[1:])
+    else:
+        incremental.cambiar_final(*edicion[1:])
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    casos = [
+        (f"enesimo_final_n{n}", afnd_enesimo_desde_el_final(n)),
+        ("aleatorio_n40", afnd_aleatorio(40, ('a', 'b'), densidad=0.04, semilla=3)),
+    ]
+    print(f"{'Caso':<22} {'estados AFD':>12} {'completa (s)':>13} {'incremental (s)':>16} "
+          f"{'mejora':>8}")
+    for nombre, base in casos:
+        ediciones = list(ediciones_aleatorias(base, cantidad))
+
+        # Reconversión completa tras cada edición (sin incluir el tiempo de editar)
+        afnd = copiar(base)
+        espejo = ConversorIncremental(copiar(base))
+        t_completa = 0.0
+        for edicion in ediciones:
+            aplicar(espejo, edicion)
+            afnd = copiar(espejo.afnd)
+            inicio = time.perf_counter()
+            esperado = ConversorAFNDaAFD.convertir_compacto(afnd)
+            t_completa += time.perf_counter() - inicio
+
+        incremental = ConversorIncremental(copiar(base))
+        inicio = time.perf_counter()
+        for edicion in ediciones:
+            aplicar(incremental, edicion)
+            obtenido = incremental.compilado()
+        t_incremental = time.perf_counter() - inicio
+
+        assert obtenido.a_afd().transiciones == esperado.a_afd().transiciones, \
+            f"{nombre}: AFD distintos"
+        print(f"{nombre:<22} {obtenido.muerto:>12,} {t_completa:>13.2f} "
+              f"{t_incremental:>16.2f} {t_completa / t_incremental:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark de escalado de la construcción por subconjuntos paralela.
+
+Convierte un AFND aleatorio grande con 1, 2, 4, ... procesos y compara
+con la conversión secuencial (y verifica que el AFD sea el mismo).
+
+Uso:
+    python benchmarks/bench_conversion_paralela.py [n_estados] [semilla]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import ConversorAFNDaAFD  # noqa: E402
+from conversion_paralela import convertir_paralelo  # noqa: E402
+from generadores import afnd_aleatorio  # noqa: E402
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    semilla = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    afnd = afnd_aleatorio(n, ('a', 'b', 'c'), densidad=0.04, semilla=semilla)
+
+    inicio = time.perf_counter()
+    referencia = ConversorAFNDaAFD.convertir(afnd)
+    t_secuencial = time.perf_counter() - inicio
+    print(f"AFND: {n} estados → AFD: {len(referencia.estados)} estados")
+    print(f"  secuencial   : {t_secuencial:.3f} s")
+
+    nucleos = os.cpu_count() or 1
+    pruebas = [1]
+    while pruebas[-1] * 2 <= nucleos:
+        pruebas.append(pruebas[-1] * 2)
+    if pruebas[-1] != nucleos:
+        pruebas.append(nucleos)
+
+    for trabajadores in pruebas:
+        inicio = time.perf_counter()
+        afd = convertir_paralelo(afnd, trabajadores=trabajadores, min_paralelo=1)
+        t = time.perf_counter() - inicio
+        igual = (afd.transiciones == referencia.transiciones
+                 and afd.estados_finales == referencia.estados_finales)
+        print(f"  {trabajadores:>3} procesos : {t:.3f} s  (x{t_secuencial / t:.2f})  "
+              f"AFD idéntico: {'sí' if igual else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
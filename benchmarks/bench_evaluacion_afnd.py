@@ -0,0 +1,56 @@
+"""
+Benchmark de la simulación directa de AFND.
+
+Compara la evaluación bit-paralela (AFND.evaluar_cadena, máscaras con tablas
+por bloques de 8 estados) contra la simulación original con conjuntos de
+nombres: AFND.mover más una ε-clausura por recorrido del diccionario
+(AFND.evaluar_cadena_conjuntos), sin convertir a AFD. "cadena_n20000" es el
+caso ralo: un solo estado activo en un autómata grande.
+
+Uso:
+    python benchmarks/bench_evaluacion_afnd.py [cadenas] [longitud_max]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generadores import (  # noqa: E402
+    afnd_aleatorio, afnd_cadena, afnd_enesimo_desde_el_final, cadenas_aleatorias
+)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    longitud_max = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+    casos = [
+        ("enesimo_final_n12", afnd_enesimo_desde_el_final(12)),
+        ("aleatorio_n50", afnd_aleatorio(50, ('a', 'b'), densidad=0.05, semilla=1)),
+        ("aleatorio_n200", afnd_aleatorio(200, ('a', 'b'), densidad=0.02, semilla=2)),
+        ("aleatorio_eps_n200", afnd_aleatorio(200, ('a', 'b'), densidad=0.02, semilla=3,
+                                              prob_epsilon=0.01)),
+        ("aleatorio_n1000", afnd_aleatorio(1000, ('a', 'b'), densidad=0.004, semilla=4)),
+        ("cadena_n20000", afnd_cadena(20000)),
+    ]
+    print(f"{'Caso':<22} {'conjuntos (c/s)':>16} {'bits (c/s)':>14} {'mejora':>8}")
+    for nombre, afnd in casos:
+        cadenas = cadenas_aleatorias(sorted(afnd.alfabeto), cantidad, longitud_max, semilla=0)
+        afnd.indexar()
+
+        inicio = time.perf_counter()
+        esperado = [afnd.evaluar_cadena_conjuntos(c) for c in cadenas]
+        t_conjuntos = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        obtenido = [afnd.evaluar_cadena(c) for c in cadenas]
+        t_bits = time.perf_counter() - inicio
+
+        assert obtenido == esperado, f"{nombre}: resultados distintos"
+        print(f"{nombre:<22} {cantidad / t_conjuntos:>16,.0f} {cantidad / t_bits:>14,.0f} "
+              f"{t_conjuntos / t_bits:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark de memoria de las representaciones de autómatas.
+
+Compara la memoria retenida por la representación con nombres (AFND con
+conjuntos por transición, AFD de ConversorAFNDaAFD.convertir) contra la
+compacta (AFNDCompacto con arreglos CSR int32, AFDCompilado de
+convertir_compacto con nombres perezosos), y el pico de memoria de cada
+conversión. AFNDIndexado (una máscara por estado y símbolo) se muestra como
+referencia: es la forma de trabajo de la conversión, no de almacenamiento.
+
+Uso:
+    python benchmarks/bench_memoria.py [n]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import AFNDCompacto, AFNDIndexado, ConversorAFNDaAFD, LimitesConversion  # noqa: E402
+from generadores import afnd_aleatorio, afnd_enesimo_desde_el_final  # noqa: E402
+
+
+def medir(funcion):
+    """(resultado, bytes retenidos, bytes pico, segundos) de construir el objeto"""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    retenidos, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, retenidos, pico, segundos
+
+
+def fila(nombre: str, retenidos: int, pico: int, segundos: float, base: int = None):
+    reduccion = f"x{base / retenidos:.1f}" if base else ""
+    print(f"  {nombre:<24} {retenidos / 2**20:>10.2f} {pico / 2**20:>10.2f} "
+          f"{segundos:>8.2f} {reduccion:>8}")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    # (nombre, AFND, máximo de estados AFD: los aleatorios se cortan antes de explotar)
+    casos = [
+        (f"enesimo_final_n{n}", afnd_enesimo_desde_el_final(n), None),
+        ("aleatorio_n200_k3", afnd_aleatorio(200, ('a', 'b', 'c'), densidad=0.01, semilla=5),
+         20000),
+        ("aleatorio_n5000_k3", afnd_aleatorio(5000, ('a', 'b', 'c'), densidad=0.001, semilla=6),
+         2000),
+    ]
+    for nombre, afnd, max_estados in casos:
+        print(f"\n{nombre}")
+        print(f"  {'Representación':<24} {'retenido MB':>10} {'pico MB':>10} {'s':>8} {'mejora':>8}")
+
+        # El AFND ya existe: se mide lo que ocupan sus estructuras al copiarlas
+        _, r_afnd, p_afnd, s_afnd = medir(
+            lambda: ({(o, s): set(d) for (o, s), d in afnd.transiciones.items()},
+                     set(afnd.estados)))
+        fila("AFND (conjuntos)", r_afnd, p_afnd, s_afnd)
+        _, r_cc, p_cc, s_cc = medir(lambda: AFNDCompacto.desde_afnd(afnd))
+        fila("AFNDCompacto (CSR)", r_cc, p_cc, s_cc, r_afnd)
+        indexado, r_ix, p_ix, s_ix = medir(lambda: AFNDIndexado.desde_afnd(afnd))
+        fila("AFNDIndexado", r_ix, p_ix, s_ix, r_afnd)
+
+        limites = LimitesConversion(max_estados=max_estados)
+        afd, r_afd, p_afd, s_afd = medir(
+            lambda: ConversorAFNDaAFD.convertir(indexado, limites=limites))
+        fila("AFD (nombres)", r_afd, p_afd, s_afd)
+        del afd
+        compacto, r_c, p_c, s_c = medir(
+            lambda: ConversorAFNDaAFD.convertir_compacto(indexado, limites=limites))
+        fila("AFDCompilado compacto", r_c, p_c, s_c, r_afd)
+        print(f"  ({compacto.muerto:,} estados AFD)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark de escalado de la evaluación paralela por fragmentos.
+
+Genera un archivo de cadenas aleatorias y lo evalúa con 1, 2, 4, 8, ...
+procesos hasta el número de núcleos disponibles.
+
+Uso:
+    python benchmarks/bench_paralelo.py [lineas] [tam_fragmento_bytes]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import ConversorAFNDaAFD  # noqa: E402
+from evaluacion_paralela import evaluar_archivo_paralelo  # noqa: E402
+from generadores import afnd_enesimo_desde_el_final  # noqa: E402
+
+
+def main():
+    lineas = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    tam_fragmento = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * 1024 * 1024
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        afd = ConversorAFNDaAFD.convertir(afnd_enesimo_desde_el_final(8))
+
+    rng = random.Random(0)
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        for _ in range(lineas):
+            f.write(''.join(rng.choice('ab') for _ in range(rng.randint(1, 40))) + '\n')
+        ruta = f.name
+
+    try:
+        nucleos = os.cpu_count() or 1
+        pruebas = [1]
+        while pruebas[-1] * 2 <= nucleos:
+            pruebas.append(pruebas[-1] * 2)
+        if pruebas[-1] != nucleos:
+            pruebas.append(nucleos)
+
+        base = None
+        for n in pruebas:
+            resumen, _ = evaluar_archivo_paralelo(afd, ruta, trabajadores=n,
+                                                  tam_fragmento=tam_fragmento)
+            base = base or resumen.segundos
+            print(f"{n:>3} procesos: {resumen.lineas_por_segundo:>12,.0f} líneas/s  "
+                  f"(x{base / resumen.segundos:.2f})")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Prueba de carga del servicio de evaluación (src/servidor.py).
+
+Levanta el servidor en un subproceso con un AFND generado (salvo que se pase
+--puerto de un servidor ya en marcha), abre varias conexiones que envían
+pedidos en paralelo sin esperar respuesta y reporta latencia p50/p99 por
+pedido y el rendimiento en cadenas por segundo.
+
+Uso:
+    python benchmarks/carga_servidor.py [--clientes 8] [--pedidos 200] [--lote 512]
+    python benchmarks/carga_servidor.py --puerto 8765 --automata nombre
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import guardar_afnd_en_json  # noqa: E402
+from generadores import afnd_enesimo_desde_el_final  # noqa: E402
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def percentil(valores, p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+async def cliente(host: str, puerto: int, automata: str, pedidos: int, lote: int,
+                  en_vuelo: int, semilla: int, latencias: list):
+    lector, escritor = await asyncio.open_connection(host, puerto, limit=1 << 26)
+    azar = random.Random(semilla)
+    enviados = {}
+    ventana = asyncio.Semaphore(en_vuelo)
+
+    async def _recibir():
+        for _ in range(pedidos):
+            respuesta = json.loads(await lector.readline())
+            if "error" in respuesta:
+                raise RuntimeError(respuesta["error"])
+            latencias.append(time.perf_counter() - enviados.pop(respuesta["id"]))
+            ventana.release()
+
+    receptor = asyncio.create_task(_recibir())
+    for i in range(pedidos):
+        cadenas = ["".join(azar.choice("ab") for _ in range(azar.randint(10, 60)))
+                   for _ in range(lote)]
+        await ventana.acquire()
+        enviados[i] = time.perf_counter()
+        escritor.write(json.dumps({"id": i, "automata": automata,
+                                   "cadenas": cadenas}).encode() + b"\n")
+        await escritor.drain()
+    await receptor
+    escritor.close()
+
+
+async def esperar_puerto(host: str, puerto: int, proceso: subprocess.Popen):
+    while True:
+        if proceso.poll() is not None:
+            raise RuntimeError("El servidor terminó antes de aceptar conexiones")
+        try:
+            _, escritor = await asyncio.open_connection(host, puerto)
+            escritor.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+
+
+async def correr(args, latencias: list) -> float:
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        cliente(args.host, args.puerto, args.automata, args.pedidos, args.lote,
+                args.en_vuelo, semilla, latencias)
+        for semilla in range(args.clientes)))
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio de evaluación")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=None,
+                        help="servidor ya en marcha (si no, se levanta uno)")
+    parser.add_argument("--automata", default="enesimo")
+    parser.add_argument("--n", type=int, default=10, help="n del AFND generado")
+    parser.add_argument("--clientes", type=int, default=8)
+    parser.add_argument("--pedidos", type=int, default=200, help="pedidos por cliente")
+    parser.add_argument("--lote", type=int, default=512,
+                        help="cadenas por pedido (más de 256 usa el pool del servidor)")
+    parser.add_argument("--en-vuelo", type=int, default=16,
+                        help="pedidos sin respuesta por conexión")
+    parser.add_argument("--trabajadores", type=int, default=None)
+    args = parser.parse_args()
+
+    proceso = None
+    directorio = None
+    if args.puerto is None:
+        directorio = tempfile.mkdtemp(prefix="carga_")
+        with contextlib.redirect_stdout(io.StringIO()):
+            guardar_afnd_en_json(afnd_enesimo_desde_el_final(args.n),
+                                 os.path.join(directorio, args.automata))
+        args.puerto = 8765
+        comando = [sys.executable, os.path.join(RAIZ, "src", "servidor.py"),
+                   os.path.join(directorio, f"{args.automata}.json"),
+                   "--host", args.host, "--puerto", str(args.puerto)]
+        if args.trabajadores:
+            comando += ["--trabajadores", str(args.trabajadores)]
+        proceso = subprocess.Popen(comando, stdout=subprocess.DEVNULL)
+
+    try:
+        if proceso is not None:
+            asyncio.run(esperar_puerto(args.host, args.puerto, proceso))
+        latencias: list = []
+        segundos = asyncio.run(correr(args, latencias))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+        if directorio is not None:
+            for archivo in os.listdir(directorio):
+                os.remove(os.path.join(directorio, archivo))
+            os.rmdir(directorio)
+
+    total_pedidos = len(latencias)
+    print(f"{args.clientes} clientes × {args.pedidos} pedidos × {args.lote} cadenas "
+          f"({args.en_vuelo} en vuelo por conexión)")
+    print(f"  p50      {percentil(latencias, 50) * 1000:>10.2f} ms")
+    print(f"  p99      {percentil(latencias, 99) * 1000:>10.2f} ms")
+    print(f"  pedidos  {total_pedidos / segundos:>10.0f} /s")
+    print(f"  cadenas  {total_pedidos * args.lote / segundos:>10.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Generadores reproducibles de autómatas y cadenas para los benchmarks.
+"""
+import os
+import random
+import sys
+from typing import List, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import AFND, EPSILON  # noqa: E402
+
+
+def afnd_aleatorio(n_estados: int, alfabeto: Sequence[str] = ('a', 'b'),
+                   densidad: float = 0.3, semilla: int = 0,
+                   prob_final: float = 0.2, prob_epsilon: float = 0.0) -> AFND:
+    """
+    AFND aleatorio con semilla fija. `densidad` es la probabilidad de que
+    cada par (origen, destino) exista para un símbolo dado; `prob_epsilon`
+    la de cada transición vacía.
+    """
+    rng = random.Random(semilla)
+    estados = [f"q{i}" for i in range(n_estados)]
+    transiciones = {}
+    for origen in estados:
+        for simbolo in alfabeto:
+            destinos = {d for d in estados if rng.random() < densidad}
+            if destinos:
+                transiciones[(origen, simbolo)] = destinos
+        if prob_epsilon:
+            destinos = {d for d in estados if d != origen and rng.random() < prob_epsilon}
+            if destinos:
+                transiciones[(origen, EPSILON)] = destinos
+    finales = {e for e in estados if rng.random() < prob_final} or {estados[-1]}
+    return AFND(set(estados), set(alfabeto), transiciones, estados[0], finales)
+
+
+def afnd_enesimo_desde_el_final(n: int) -> AFND:
+    """L = cadenas sobre {a,b} cuyo n-ésimo símbolo desde el final es 'a' (2^n estados AFD)"""
+    estados = {f"q{i}" for i in range(n + 1)}
+    transiciones = {("q0", "a"): {"q0", "q1"}, ("q0", "b"): {"q0"}}
+    for i in range(1, n):
+        transiciones[(f"q{i}", "a")] = {f"q{i + 1}"}
+        transiciones[(f"q{i}", "b")] = {f"q{i + 1}"}
+    return AFND(estados, {"a", "b"}, transiciones, "q0", {f"q{n}"})
+
+
+def afnd_cadena(n: int, alfabeto: Sequence[str] = ('a', 'b')) -> AFND:
+    """Cadena q0 → q1 → ... → q(n-1) con todos los símbolos: un solo estado activo (caso ralo)"""
+    estados = [f"q{i}" for i in range(n)]
+    transiciones = {(estados[i], s): {estados[i + 1]} for i in range(n - 1) for s in alfabeto}
+    return AFND(set(estados), set(alfabeto), transiciones, estados[0], {estados[-1]})
+
+
+def cadenas_aleatorias(alfabeto: Sequence[str], cantidad: int, longitud_max: int,
+                       semilla: int = 0) -> List[str]:
+    rng = random.Random(semilla)
+    simbolos = list(alfabeto)
+    return [''.join(rng.choice(simbolos) for _ in range(rng.randint(0, longitud_max)))
+            for _ in range(cantidad)]
@@ -0,0 +1,170 @@
+"""
+Suite de benchmarks reproducible.
+
+Mide la conversión AFND → AFD, el throughput de evaluación (AFND con máscaras y
+con conjuntos, AFD cadena a cadena y AFD por lotes) y la carga/guardado (JSON
+y columnar) sobre autómatas generados con semilla fija. Reporta operaciones/s
+y memoria pico, y escribe los resultados en JSON para comparar entre commits.
+
+Uso:
+    python benchmarks/suite.py [--rapido] [--salida ruta.json] [--comparar previo.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logica_automata import (  # noqa: E402
+    ConversorAFNDaAFD, guardar_afnd_en_json, cargar_afnd_desde_json,
+    cargar_afnd_json_incremental
+)
+from persistencia_binaria import guardar_afnd_columnar, cargar_afnd_columnar  # noqa: E402
+from generadores import (  # noqa: E402
+    afnd_aleatorio, afnd_enesimo_desde_el_final, cadenas_aleatorias
+)
+
+DIRECTORIO_RESULTADOS = os.path.join(os.path.dirname(__file__), 'resultados')
+
+
+def medir(funcion, operaciones: int = 1, repeticiones: int = 3) -> dict:
+    """Mejor tiempo de `repeticiones` ejecuciones y memoria pico de la primera"""
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return {
+        "segundos": mejor,
+        "operaciones": operaciones,
+        "ops_por_segundo": operaciones / mejor if mejor > 0 else 0.0,
+        "memoria_pico_bytes": pico,
+    }
+
+
+def casos(rapido: bool):
+    """(nombre, AFND) de cada autómata de prueba"""
+    ns = (8, 10) if rapido else (10, 12, 14)
+    for n in ns:
+        yield f"enesimo_final_n{n}", afnd_enesimo_desde_el_final(n)
+    tamanos = (20, 60) if rapido else (50, 200)
+    for n in tamanos:
+        yield (f"aleatorio_n{n}_k3_d05",
+               afnd_aleatorio(n, ('a', 'b', 'c'), densidad=0.05, semilla=n))
+    yield (f"aleatorio_eps_n{tamanos[0]}",
+           afnd_aleatorio(tamanos[0], ('a', 'b'), densidad=0.08, semilla=7, prob_epsilon=0.05))
+
+
+def ejecutar(rapido: bool) -> dict:
+    n_cadenas = 2000 if rapido else 20000
+    resultados = {}
+    for nombre, afnd in casos(rapido):
+        afd = ConversorAFNDaAFD.convertir(afnd)
+        cadenas = cadenas_aleatorias(sorted(afd.alfabeto), n_cadenas, 40, semilla=1)
+        afd.compilar()
+
+        def _convertir():
+            afnd.invalidar_cache()
+            ConversorAFNDaAFD.convertir(afnd)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = os.path.join(tmp, nombre)
+            with contextlib.redirect_stdout(io.StringIO()):
+                guardar_afnd_en_json(afnd, ruta)
+                guardar_afnd_columnar(afnd, ruta)
+            n_trans = sum(len(d) for d in afnd.transiciones.values())
+            resultados[nombre] = {
+                "afnd_estados": len(afnd.estados),
+                "afd_estados": len(afd.estados),
+                "conversion": medir(_convertir, len(afd.estados)),
+                "evaluacion_afnd": medir(lambda: [afnd.evaluar_cadena(c) for c in cadenas],
+                                         n_cadenas),
+                "evaluacion_afnd_conjuntos": medir(
+                    lambda: [afnd.evaluar_cadena_conjuntos(c) for c in cadenas], n_cadenas),
+                "evaluacion_afd": medir(lambda: [afd.evaluar_cadena(c) for c in cadenas],
+                                        n_cadenas),
+                "evaluacion_afd_lote": medir(lambda: afd.evaluar_lote(cadenas), n_cadenas),
+                "json_guardar": medir(lambda: guardar_afnd_en_json(afnd, ruta), n_trans),
+                "json_cargar": medir(lambda: cargar_afnd_desde_json(ruta), n_trans),
+                "json_cargar_incremental": medir(lambda: cargar_afnd_json_incremental(ruta),
+                                                 n_trans),
+                "columnar_cargar": medir(lambda: cargar_afnd_columnar(ruta), n_trans),
+            }
+        print(f"  ✓ {nombre}")
+    return resultados
+
+
+def commit_actual() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except OSError:
+        return ""
+
+
+def imprimir(resultados: dict, previo: dict = None):
+    print(f"\n{'Caso':<26} {'Medida':<22} {'ops/s':>14} {'pico (KB)':>11} {'vs previo':>10}")
+    print("-" * 87)
+    for caso, medidas in resultados.items():
+        for medida, valor in medidas.items():
+            if not isinstance(valor, dict):
+                continue
+            comparacion = ""
+            anterior = (previo or {}).get(caso, {}).get(medida)
+            if anterior and anterior["ops_por_segundo"]:
+                comparacion = f"x{valor['ops_por_segundo'] / anterior['ops_por_segundo']:.2f}"
+            print(f"{caso:<26} {medida:<22} {valor['ops_por_segundo']:>14,.0f} "
+                  f"{valor['memoria_pico_bytes'] / 1024:>11,.0f} {comparacion:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rapido", action="store_true", help="casos pequeños")
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    parser.add_argument("--comparar", help="JSON de una ejecución anterior")
+    args = parser.parse_args()
+
+    print("Ejecutando benchmarks...")
+    commit = commit_actual()
+    datos = {
+        "commit": commit,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "rapido": args.rapido,
+        "resultados": ejecutar(args.rapido),
+    }
+
+    previo = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            previo = json.load(f)["resultados"]
+    imprimir(datos["resultados"], previo)
+
+    salida = args.salida
+    if not salida:
+        os.makedirs(DIRECTORIO_RESULTADOS, exist_ok=True)
+        salida = os.path.join(DIRECTORIO_RESULTADOS,
+                              f"{time.strftime('%Y%m%d_%H%M%S')}_{commit or 'sin_commit'}.json")
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(datos, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Resultados guardados en '{salida}'")
+
+
+if __name__ == "__main__":
+    main()
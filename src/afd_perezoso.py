@@ -0,0 +1,137 @@
+from typing import Dict, List, Optional, Union
+
+from logica_automata import AFND, AFNDCompacto, AFNDIndexado
+
+
+# ============================================================
+# AFD PEREZOSO (construcción de subconjuntos bajo demanda)
+# ============================================================
+
+# Caracteres que se simulan sobre el AFND (por ventana) cuando la caché no rinde
+VENTANAS_DIRECTAS = 8
+
+
+class AFDPerezoso:
+    """
+    Evalúa cadenas sobre un AFND construyendo los estados del AFD solo cuando
+    una cadena los necesita. Cada subconjunto (máscara de bits) se registra
+    una vez con un id entero y sus transiciones se guardan como filas de ids.
+    Cuando hay `max_estados` estados, la caché se vacía entera y se vuelve a
+    llenar (como RE2): así las filas nunca apuntan a ids expulsados.
+
+    Cada `ventana` consultas, abarcando varias cadenas, se mide la tasa de
+    aciertos; si queda por debajo de `min_tasa_aciertos`, los siguientes
+    VENTANAS_DIRECTAS * `ventana` caracteres se simulan directamente sobre el
+    AFND y después se vuelve a probar la caché.
+    """
+
+    def __init__(self, afnd: Union[AFND, AFNDIndexado, AFNDCompacto], max_estados: int = 4096,
+                 ventana: int = 4096, min_tasa_aciertos: float = 0.5):
+        if max_estados < 1:
+            raise ValueError("max_estados debe ser al menos 1")
+        if ventana < 1:
+            raise ValueError("ventana debe ser al menos 1")
+        self.afnd = afnd.indexar()
+        self.max_estados = max_estados
+        self.ventana = ventana
+        self.min_tasa_aciertos = min_tasa_aciertos
+        # máscara → id; id → máscara; id → fila de ids destino por símbolo (-1 = sin calcular)
+        self._ids: Dict[int, int] = {}
+        self._mascaras: List[int] = []
+        self._filas: List[List[int]] = []
+        # Consultas y aciertos de la ventana en curso; caracteres pendientes sin caché
+        self._consultas = 0
+        self._aciertos_ventana = 0
+        self._directos = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.vaciados = 0
+        self.recurrencias_afnd = 0
+
+    def _id(self, mascara: int) -> int:
+        id_estado = self._ids.get(mascara)
+        if id_estado is None:
+            if len(self._mascaras) >= self.max_estados:
+                # Se vacían en el lugar: quien tenga las listas en variables locales sigue válido
+                self._ids.clear()
+                self._mascaras.clear()
+                self._filas.clear()
+                self.vaciados += 1
+            id_estado = len(self._mascaras)
+            self._ids[mascara] = id_estado
+            self._mascaras.append(mascara)
+            self._filas.append([-1] * len(self.afnd.simbolos))
+        return id_estado
+
+    def _cerrar_ventana(self):
+        if self._aciertos_ventana < self.min_tasa_aciertos * self._consultas:
+            self._directos = VENTANAS_DIRECTAS * self.ventana
+            self.recurrencias_afnd += 1
+        self._consultas = self._aciertos_ventana = 0
+
+    def estado_final(self, cadena: str) -> Optional[int]:
+        """Máscara de estados del AFND tras leer la cadena (None si hay un símbolo inválido)"""
+        afnd = self.afnd
+        indice = afnd.indice_simbolo
+        mascaras, filas = self._mascaras, self._filas
+        # estado = id en la caché; None mientras se simula con `mascara` sobre el AFND
+        estado: Optional[int] = None
+        mascara = afnd.inicial
+
+        for caracter in cadena:
+            s = indice.get(caracter)
+            if s is None:
+                return None
+            if self._directos:
+                self._directos -= 1
+                if estado is not None:
+                    mascara, estado = mascaras[estado], None
+                mascara = afnd.mover_por_bloques(mascara, s)
+                if not mascara:
+                    return 0
+                continue
+
+            if estado is None:
+                estado = self._id(mascara)
+            fila = filas[estado]
+            destino = fila[s]
+            if destino < 0:
+                self.fallos += 1
+                vaciados = self.vaciados
+                destino = self._id(afnd.mover_por_bloques(mascaras[estado], s))
+                if vaciados == self.vaciados:
+                    fila[s] = destino
+            else:
+                self.aciertos += 1
+                self._aciertos_ventana += 1
+            estado = destino
+            self._consultas += 1
+            if self._consultas >= self.ventana:
+                self._cerrar_ventana()
+            if not mascaras[estado]:
+                return 0
+        return mascara if estado is None else mascaras[estado]
+
+    def evaluar_cadena(self, cadena: str) -> bool:
+        mascara = self.estado_final(cadena)
+        return bool(mascara and mascara & self.afnd.finales)
+
+    def cantidad_estados(self) -> int:
+        return len(self._mascaras)
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            "estados_en_cache": len(self._mascaras),
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "vaciados": self.vaciados,
+            "recurrencias_afnd": self.recurrencias_afnd,
+        }
+
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores"""
+        self._ids.clear()
+        self._mascaras.clear()
+        self._filas.clear()
+        self._consultas = self._aciertos_ventana = self._directos = 0
+        self.aciertos = self.fallos = self.vaciados = self.recurrencias_afnd = 0
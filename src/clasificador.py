@@ -0,0 +1,138 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from afd_perezoso import AFDPerezoso
+from logica_automata import AFND, AFNDIndexado
+
+
+# ============================================================
+# CLASIFICACIÓN CONTRA VARIOS AUTÓMATAS EN UNA PASADA
+# ============================================================
+
+def unir_automatas(automatas: Sequence[Union[AFND, AFNDIndexado]]
+                   ) -> Tuple[AFNDIndexado, List[int]]:
+    """
+    Unión disjunta de los autómatas como un solo AFND indexado: los estados
+    del autómata k se desplazan a su propio rango de bits y se renombran
+    "k:estado". Devuelve también la máscara de finales de cada autómata.
+    Un símbolo que no está en el alfabeto de k lo deja sin estados, igual que
+    en su evaluación por separado.
+    """
+    indexados = [a.indexar() for a in automatas]
+    simbolos = sorted({s for ix in indexados for s in ix.simbolos})
+    nombres: List[str] = []
+    desplazamientos = []
+    for k, ix in enumerate(indexados):
+        desplazamientos.append(len(nombres))
+        nombres.extend(f"{k}:{n}" for n in ix.nombres)
+
+    sucesores = []
+    for simbolo in simbolos:
+        fila: List[int] = []
+        for ix, d in zip(indexados, desplazamientos):
+            s = ix.indice_simbolo.get(simbolo)
+            if s is None:
+                fila.extend([0] * len(ix.nombres))
+            else:
+                # Las ε-clausuras ya están incluidas en los sucesores de cada uno
+                fila.extend(m << d for m in ix.sucesores[s])
+        sucesores.append(fila)
+
+    finales_por_automata = [ix.finales << d for ix, d in zip(indexados, desplazamientos)]
+    inicial = finales = 0
+    for ix, d, f in zip(indexados, desplazamientos, finales_por_automata):
+        inicial |= ix.inicial << d
+        finales |= f
+    return AFNDIndexado(nombres, simbolos, sucesores, inicial, finales), finales_por_automata
+
+
+class ClasificadorMultiple:
+    """
+    Indica qué autómatas aceptan una cadena recorriéndola una sola vez.
+
+    Se construye el AFD de la unión disjunta por subconjuntos y cada estado
+    queda etiquetado con los índices de los autómatas que aceptan en él. Si
+    el AFD combinado supera `max_estados`, se abandona la construcción y se
+    usa un AFDPerezoso sobre la unión (caché de `max_estados_perezoso` estados).
+    """
+
+    def __init__(self, automatas: Sequence[Union[AFND, AFNDIndexado]],
+                 max_estados: int = 100_000, max_estados_perezoso: int = 4096):
+        if not automatas:
+            raise ValueError("Se necesita al menos un autómata")
+        self.cantidad = len(automatas)
+        self.union, self._finales = unir_automatas(automatas)
+        self.simbolos = self.union.simbolos
+        self.columna = self.union.indice_simbolo
+        self.perezoso: Optional[AFDPerezoso] = None
+        # Etiquetas repetidas se comparten: máscara de aceptación → tupla de índices
+        self._etiquetas_por_mascara: Dict[int, Tuple[int, ...]] = {}
+
+        if not self._construir(max_estados):
+            self.tabla: List[int] = []
+            self.etiquetas: List[Tuple[int, ...]] = []
+            self.perezoso = AFDPerezoso(self.union, max_estados=max_estados_perezoso)
+
+    @property
+    def modo(self) -> str:
+        return "perezoso" if self.perezoso is not None else "afd"
+
+    def _etiqueta(self, mascara: int) -> Tuple[int, ...]:
+        aceptacion = mascara & self.union.finales
+        etiqueta = self._etiquetas_por_mascara.get(aceptacion)
+        if etiqueta is None:
+            etiqueta = tuple(k for k, f in enumerate(self._finales) if aceptacion & f)
+            self._etiquetas_por_mascara[aceptacion] = etiqueta
+        return etiqueta
+
+    def _construir(self, max_estados: int) -> bool:
+        """Construcción por subconjuntos; False si se pasa del máximo de estados"""
+        union = self.union
+        n_simbolos = len(self.simbolos)
+        mascaras = [union.inicial]
+        ids = {union.inicial: 0}
+        tabla: List[int] = []
+        i = 0
+        while i < len(mascaras):
+            mascara = mascaras[i]
+            for s in range(n_simbolos):
+                destino = union.mover(mascara, s)
+                id_destino = ids.get(destino)
+                if id_destino is None:
+                    if len(mascaras) >= max_estados:
+                        return False
+                    id_destino = len(mascaras)
+                    ids[destino] = id_destino
+                    mascaras.append(destino)
+                tabla.append(id_destino)
+            i += 1
+        self.tabla = tabla
+        self.etiquetas = [self._etiqueta(m) for m in mascaras]
+        # Estado sin salida posible (todos los autómatas muertos), si existe
+        self._muerto = ids.get(0)
+        return True
+
+    def clasificar(self, cadena: str) -> Tuple[int, ...]:
+        """Índices (en el orden recibido) de los autómatas que aceptan la cadena"""
+        if self.perezoso is not None:
+            mascara = self.perezoso.estado_final(cadena)
+            return self._etiqueta(mascara) if mascara else ()
+
+        columna, tabla, ancho = self.columna, self.tabla, len(self.simbolos)
+        muerto = self._muerto
+        estado = 0
+        for caracter in cadena:
+            s = columna.get(caracter)
+            if s is None:
+                return ()
+            estado = tabla[estado * ancho + s]
+            if estado == muerto:
+                return ()
+        return self.etiquetas[estado]
+
+    def clasificar_lote(self, cadenas: Sequence[str]) -> List[Tuple[int, ...]]:
+        return [self.clasificar(c) for c in cadenas]
+
+    def cantidad_estados(self) -> int:
+        if self.perezoso is not None:
+            return self.perezoso.cantidad_estados()
+        return len(self.etiquetas)
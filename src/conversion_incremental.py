@@ -0,0 +1,219 @@
+from typing import Dict, List
+
+from logica_automata import (
+    AFND, AFD, AFDCompilado, AFNDIndexado, ConversorAFNDaAFD, EPSILON, EstadisticasConversion
+)
+
+
+# ============================================================
+# CONVERSIÓN AFND → AFD INCREMENTAL
+# ============================================================
+
+class ConversorIncremental:
+    """
+    Mantiene el AFD de un AFND mientras este se edita, sin repetir toda la
+    construcción por subconjuntos.
+
+    Al agregar o quitar la transición (q, s) solo cambia la columna s de los
+    estados AFD cuyo subconjunto contiene a q: se recalculan esas entradas y
+    se exploran los subconjuntos nuevos que aparezcan; el resto de la tabla se
+    conserva. Cambiar un estado final no toca la tabla. Los estados que dejan
+    de ser alcanzables se descartan al pedir el AFD, que queda igual al de
+    ConversorAFNDaAFD.convertir. Editar transiciones ε cambia las clausuras de
+    forma global, así que en ese caso se reconstruye todo.
+
+    Las ediciones se aplican también sobre el AFND recibido.
+    """
+
+    def __init__(self, afnd: AFND):
+        self.afnd = afnd
+        self.recalculadas = 0      # entradas de la tabla recalculadas en total
+        self.reconstrucciones = 0  # veces que hubo que convertir desde cero
+        self._reconstruir()
+
+    def _reconstruir(self):
+        self.afnd.invalidar_cache()
+        # Vista indexada propia (no la caché del AFND): se edita en el lugar. Los
+        # índices de estados y símbolos no cambian mientras dure la edición
+        self.indexado = AFNDIndexado.desde_afnd(self.afnd)
+        self.mascaras, self.filas = ConversorAFNDaAFD._explorar(
+            self.indexado, EstadisticasConversion(), None, 1000, None)
+        self.ids: Dict[int, int] = {m: j for j, m in enumerate(self.mascaras)}
+        # Ids de subconjuntos nuevos cuya fila aún no se calculó
+        self._pendientes: List[int] = []
+        self._sucio = False
+        self.reconstrucciones += 1
+
+    # ------------------------------------------------------------
+    # Índices del AFND
+    # ------------------------------------------------------------
+
+    def _estado(self, nombre: str) -> int:
+        """Índice del estado, agregándolo si es nuevo (sin transiciones ni ε)"""
+        ix = self.indexado
+        q = ix.indice.get(nombre)
+        if q is None:
+            q = len(ix.nombres)
+            ix.nombres.append(nombre)
+            ix.indice[nombre] = q
+            for fila in ix.sucesores:
+                fila.append(0)
+            if ix.clausuras is not None:
+                ix.clausuras.append(1 << q)
+            ix.descartar_tablas()
+            self.afnd.estados.add(nombre)
+        return q
+
+    def _simbolo(self, simbolo: str) -> int:
+        """Índice del símbolo; uno nuevo agrega una columna a todos los estados AFD"""
+        ix = self.indexado
+        s = ix.indice_simbolo.get(simbolo)
+        if s is None:
+            s = len(ix.simbolos)
+            ix.simbolos.append(simbolo)
+            ix.indice_simbolo[simbolo] = s
+            ix.sucesores.append([0] * len(ix.nombres))
+            ix.descartar_tablas()
+            self.afnd.alfabeto.add(simbolo)
+            # Todavía nadie tiene transiciones con él: todos van a ∅
+            vacio = self._id(0)
+            for fila in self.filas:
+                if fila is not None:
+                    fila.append(vacio)
+            self._sucio = True
+        return s
+
+    # ------------------------------------------------------------
+    # Mantenimiento de la tabla AFD
+    # ------------------------------------------------------------
+
+    def _id(self, mascara: int) -> int:
+        """Id del subconjunto; uno nuevo queda pendiente de explorar (fila None)"""
+        j = self.ids.get(mascara)
+        if j is None:
+            j = len(self.mascaras)
+            self.ids[mascara] = j
+            self.mascaras.append(mascara)
+            self.filas.append(None)
+            self._pendientes.append(j)
+        return j
+
+    def _explorar_pendientes(self):
+        """Completa las filas de los subconjuntos nuevos y de los que estos descubran"""
+        mover = self.indexado.mover
+        n_simbolos = len(self.indexado.simbolos)
+        while self._pendientes:
+            j = self._pendientes.pop()
+            mascara = self.mascaras[j]
+            self.filas[j] = [self._id(mover(mascara, s)) for s in range(n_simbolos)]
+            self.recalculadas += n_simbolos
+
+    def _actualizar_columna(self, q: int, s: int, agregado: int = 0):
+        """
+        Recalcula δ(·, s) de los estados AFD que contienen a q. Si solo se
+        agregaron destinos (`agregado`), basta unirlos al destino anterior.
+        """
+        mascaras, filas = self.mascaras, self.filas
+        for j in range(len(mascaras)):
+            mascara = mascaras[j]
+            if (mascara >> q) & 1 and filas[j] is not None:
+                if agregado:
+                    destino = mascaras[filas[j][s]] | agregado
+                else:
+                    destino = self.indexado.mover(mascara, s)
+                filas[j][s] = self._id(destino)
+                self.recalculadas += 1
+        self._explorar_pendientes()
+        self._sucio = True
+
+    def _fila_afnd(self, q: int, s: int) -> int:
+        """ε-clausura de δ(q, s) según las transiciones actuales del AFND"""
+        ix = self.indexado
+        mascara = 0
+        for d in self.afnd.transiciones.get((ix.nombres[q], ix.simbolos[s]), ()):
+            mascara |= 1 << ix.indice[d]
+        return ix.clausura(mascara)
+
+    # ------------------------------------------------------------
+    # Ediciones
+    # ------------------------------------------------------------
+
+    def agregar_transicion(self, origen: str, simbolo: str, destino: str):
+        destinos = self.afnd.transiciones.setdefault((origen, simbolo), set())
+        if destino in destinos:
+            return
+        destinos.add(destino)
+        self.afnd.invalidar_cache()
+        if simbolo == EPSILON:
+            self.afnd.estados.update((origen, destino))
+            self._reconstruir()
+            return
+        q, d = self._estado(origen), self._estado(destino)
+        s = self._simbolo(simbolo)
+        agregado = self.indexado.clausura(1 << d)
+        self.indexado.sucesores[s][q] |= agregado
+        self.indexado.descartar_tablas()
+        self._actualizar_columna(q, s, agregado)
+
+    def quitar_transicion(self, origen: str, simbolo: str, destino: str):
+        destinos = self.afnd.transiciones.get((origen, simbolo))
+        if not destinos or destino not in destinos:
+            return
+        destinos.discard(destino)
+        if not destinos:
+            del self.afnd.transiciones[(origen, simbolo)]
+        self.afnd.invalidar_cache()
+        if simbolo == EPSILON:
+            self._reconstruir()
+            return
+        ix = self.indexado
+        s = ix.indice_simbolo.get(simbolo)
+        if s is None:
+            # Símbolo fuera del alfabeto: la conversión nunca usó esta transición
+            return
+        q = ix.indice[origen]
+        ix.sucesores[s][q] = self._fila_afnd(q, s)
+        ix.descartar_tablas()
+        self._actualizar_columna(q, s)
+
+    def cambiar_final(self, estado: str, es_final: bool = True):
+        """La aceptación se calcula al armar el AFD: la tabla no cambia"""
+        q = self._estado(estado)
+        if es_final:
+            self.afnd.estados_finales.add(estado)
+            self.indexado.finales |= 1 << q
+        else:
+            self.afnd.estados_finales.discard(estado)
+            self.indexado.finales &= ~(1 << q)
+        self.afnd.invalidar_cache()
+
+    # ------------------------------------------------------------
+    # Resultado
+    # ------------------------------------------------------------
+
+    def _compactar(self):
+        """Descarta los subconjuntos inalcanzables y renumera en orden BFS"""
+        orden = [0]
+        nuevo = {0: 0}
+        i = 0
+        while i < len(orden):
+            for d in self.filas[orden[i]]:
+                if d not in nuevo:
+                    nuevo[d] = len(orden)
+                    orden.append(d)
+            i += 1
+        self.mascaras = [self.mascaras[j] for j in orden]
+        self.filas = [[nuevo[d] for d in self.filas[j]] for j in orden]
+        self.ids = {m: j for j, m in enumerate(self.mascaras)}
+        self._sucio = False
+
+    def afd(self) -> AFD:
+        if self._sucio:
+            self._compactar()
+        return ConversorAFNDaAFD.construir_afd(self.indexado, self.mascaras, self.filas)
+
+    def compilado(self) -> AFDCompilado:
+        if self._sucio:
+            self._compactar()
+        return ConversorAFNDaAFD.construir_compilado(self.indexado, list(self.mascaras),
+                                                     [list(f) for f in self.filas])
@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
+
+from logica_automata import AFND, AFD, AFNDIndexado, ConversorAFNDaAFD
+
+
+# ============================================================
+# CONSTRUCCIÓN POR SUBCONJUNTOS PARALELA (POR NIVELES DEL BFS)
+# ============================================================
+
+# AFND indexado de cada proceso trabajador
+_indexado: Optional[AFNDIndexado] = None
+
+
+def _inicializar_trabajador(indexado: AFNDIndexado):
+    global _indexado
+    _indexado = indexado
+
+
+def _expandir(mascaras: List[int]) -> List[List[int]]:
+    """Para cada subconjunto, sus destinos (máscaras) por cada símbolo"""
+    n_simbolos = len(_indexado.simbolos)
+    return [[_indexado.mover(m, s) for s in range(n_simbolos)] for m in mascaras]
+
+
+def convertir_paralelo(afnd: Union[AFND, AFNDIndexado], trabajadores: Optional[int] = None,
+                       tam_porcion: int = 512, min_paralelo: int = 2048,
+                       minimizar: bool = False) -> AFD:
+    """
+    Construcción por subconjuntos que expande cada nivel completo del BFS en
+    un pool de procesos: los trabajadores calculan `mover` para porciones de
+    `tam_porcion` subconjuntos y el coordinador deduplica los nuevos.
+    Los niveles con menos de `min_paralelo` subconjuntos se expanden en el
+    propio proceso. El AFD resultante es el mismo que el de
+    ConversorAFNDaAFD.convertir.
+    """
+    global _indexado
+    indexado = afnd.indexar()
+    trabajadores = trabajadores or os.cpu_count() or 1
+
+    mascaras = [indexado.inicial]
+    ids = {indexado.inicial: 0}
+    filas: List[Optional[List[int]]] = [None]
+    frontera = [0]
+
+    with ProcessPoolExecutor(max_workers=trabajadores,
+                             initializer=_inicializar_trabajador,
+                             initargs=(indexado,)) as ejecutor:
+        while frontera:
+            porciones = [frontera[i:i + tam_porcion]
+                         for i in range(0, len(frontera), tam_porcion)]
+            lotes = [[mascaras[j] for j in porcion] for porcion in porciones]
+            if len(frontera) >= min_paralelo and trabajadores > 1:
+                resultados = ejecutor.map(_expandir, lotes)
+            else:
+                _indexado = indexado
+                resultados = map(_expandir, lotes)
+
+            # El coordinador recorre en el orden de la frontera: numeración determinista
+            siguiente = []
+            for porcion, destinos_porcion in zip(porciones, resultados):
+                for j, destinos in zip(porcion, destinos_porcion):
+                    fila = []
+                    for destino in destinos:
+                        id_destino = ids.get(destino)
+                        if id_destino is None:
+                            id_destino = len(mascaras)
+                            ids[destino] = id_destino
+                            mascaras.append(destino)
+                            filas.append(None)
+                            siguiente.append(id_destino)
+                        fila.append(id_destino)
+                    filas[j] = fila
+            frontera = siguiente
+
+    afd = ConversorAFNDaAFD.construir_afd(indexado, mascaras, filas)
+    if minimizar:
+        afd, _ = afd.minimizar()
+    return afd
@@ -0,0 +1,215 @@
+import graphviz
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    # Solo para anotaciones: logica_automata usa construir_dot en diagramar()
+    from logica_automata import AFND, AFD
+
+
+# ============================================================
+# DIAGRAMAS CON NIVEL DE DETALLE, CACHÉ Y RENDER EN SEGUNDO PLANO
+# ============================================================
+
+Automata = Union['AFND', 'AFD']
+
+DIRECTORIO_CACHE = ".cache_diagramas"
+
+
+class OpcionesDiagrama:
+    """
+    Nivel de detalle del diagrama:
+      - ocultar_sumidero: omite los estados desde los que no se llega a un
+        final (p. ej. ∅), salvo el inicial
+      - agrupar_aristas: una sola arista por par de estados, con los
+        símbolos separados por comas
+      - vecindad: solo los estados a lo sumo a k transiciones del inicial; los
+        del borde que tienen más salidas se dibujan punteados
+      - motor: motor de graphviz ('dot', o 'sfdp' para grafos grandes)
+      - formato: 'png' o 'svg'
+    """
+
+    def __init__(self, ocultar_sumidero: bool = False, agrupar_aristas: bool = True,
+                 vecindad: Optional[int] = None, motor: str = 'dot', formato: str = 'png'):
+        self.ocultar_sumidero = ocultar_sumidero
+        self.agrupar_aristas = agrupar_aristas
+        self.vecindad = vecindad
+        self.motor = motor
+        self.formato = formato
+
+    def clave(self) -> Tuple:
+        return (self.ocultar_sumidero, self.agrupar_aristas, self.vecindad,
+                self.motor, self.formato)
+
+
+def _aristas(automata: Automata) -> List[Tuple[str, str, str]]:
+    """(origen, símbolo, destino) de cada transición, en orden estable"""
+    aristas = []
+    for (origen, simbolo), destinos in automata.transiciones.items():
+        if isinstance(destinos, str):
+            destinos = (destinos,)
+        for destino in destinos:
+            aristas.append((origen, simbolo, destino))
+    aristas.sort()
+    return aristas
+
+
+def huella_automata(automata: Automata) -> str:
+    """Hash del contenido del autómata: igual contenido, igual huella"""
+    datos = json.dumps([type(automata).__name__, sorted(automata.estados),
+                        sorted(automata.alfabeto), automata.estado_inicial,
+                        sorted(automata.estados_finales), _aristas(automata)],
+                       ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(datos.encode('utf-8')).hexdigest()
+
+
+def _utiles(automata: Automata, aristas: List[Tuple[str, str, str]]) -> Set[str]:
+    """Estados desde los que se alcanza algún final"""
+    inversas: Dict[str, List[str]] = {}
+    for origen, _, destino in aristas:
+        inversas.setdefault(destino, []).append(origen)
+    utiles = set(automata.estados_finales)
+    pila = list(utiles)
+    while pila:
+        for p in inversas.get(pila.pop(), ()):
+            if p not in utiles:
+                utiles.add(p)
+                pila.append(p)
+    return utiles
+
+
+def construir_dot(automata: Automata,
+                  opciones: Optional[OpcionesDiagrama] = None) -> graphviz.Digraph:
+    """Grafo DOT del autómata según el nivel de detalle pedido (sin renderizar)"""
+    opciones = opciones or OpcionesDiagrama()
+    aristas = _aristas(automata)
+    inicial = automata.estado_inicial
+
+    visibles = set(automata.estados) | {inicial}
+    if opciones.ocultar_sumidero:
+        visibles &= _utiles(automata, aristas) | {inicial}
+    aristas = [a for a in aristas if a[0] in visibles and a[2] in visibles]
+
+    truncados: Set[str] = set()
+    if opciones.vecindad is not None:
+        salidas: Dict[str, List[str]] = {}
+        for origen, _, destino in aristas:
+            salidas.setdefault(origen, []).append(destino)
+        distancia = {inicial: 0}
+        cola = deque([inicial])
+        while cola:
+            q = cola.popleft()
+            if distancia[q] == opciones.vecindad:
+                continue
+            for d in salidas.get(q, ()):
+                if d not in distancia:
+                    distancia[d] = distancia[q] + 1
+                    cola.append(d)
+        visibles &= set(distancia)
+        truncados = {o for o, _, d in aristas if o in visibles and d not in visibles}
+        aristas = [a for a in aristas if a[0] in visibles and a[2] in visibles]
+
+    dot = graphviz.Digraph(comment=type(automata).__name__, engine=opciones.motor)
+    dot.attr(rankdir='LR')
+    dot.attr('node', shape='circle')
+    if opciones.motor != 'dot':
+        dot.attr(overlap='false')
+    for estado in sorted(visibles):
+        atributos = {}
+        if estado in automata.estados_finales:
+            atributos['shape'] = 'doublecircle'
+        if estado in truncados:
+            atributos['style'] = 'dashed'
+        dot.node(estado, **atributos)
+    dot.node('', shape='none')
+    dot.edge('', inicial)
+
+    if opciones.agrupar_aristas:
+        agrupadas: Dict[Tuple[str, str], List[str]] = {}
+        for origen, simbolo, destino in aristas:
+            agrupadas.setdefault((origen, destino), []).append(simbolo)
+        for (origen, destino), simbolos in agrupadas.items():
+            dot.edge(origen, destino, label=','.join(sorted(set(simbolos))))
+    else:
+        for origen, simbolo, destino in aristas:
+            dot.edge(origen, destino, label=simbolo)
+    return dot
+
+
+class RenderizadorDiagramas:
+    """
+    Renderiza diagramas en un hilo de fondo para no bloquear la sesión. El
+    DOT se arma al pedirlo (así un cambio posterior al autómata no afecta el
+    resultado) y el archivo generado se guarda en `directorio_cache` bajo el
+    hash del autómata y las opciones: pedir de nuevo el mismo diagrama solo
+    copia el archivo ya renderizado.
+    """
+
+    def __init__(self, directorio_cache: str = DIRECTORIO_CACHE, hilos: int = 1):
+        self.directorio_cache = directorio_cache
+        self._ejecutor = ThreadPoolExecutor(max_workers=hilos)
+        # clave → Future del render en curso o terminado
+        self._en_curso: Dict[str, Future] = {}
+        self._candado = threading.Lock()
+
+    def _clave(self, automata: Automata, opciones: OpcionesDiagrama) -> str:
+        datos = f"{huella_automata(automata)}|{opciones.clave()}"
+        return hashlib.sha256(datos.encode('utf-8')).hexdigest()[:32]
+
+    def _ruta(self, clave: str, extension: str) -> str:
+        return os.path.join(self.directorio_cache, f"{clave}.{extension}")
+
+    def _renderizar(self, fuente: str, clave: str, opciones: OpcionesDiagrama) -> str:
+        os.makedirs(self.directorio_cache, exist_ok=True)
+        with open(self._ruta(clave, 'dot'), "w", encoding="utf-8") as f:
+            f.write(fuente)
+        ruta = self._ruta(clave, opciones.formato)
+        graphviz.Source(fuente, engine=opciones.motor).render(
+            outfile=ruta, format=opciones.formato, cleanup=True)
+        return ruta
+
+    def solicitar(self, automata: Automata, nombre_archivo: str,
+                  opciones: Optional[OpcionesDiagrama] = None) -> 'Future[str]':
+        """
+        Encola el diagrama y devuelve un Future con la ruta final
+        `nombre_archivo.<formato>` (o la excepción si graphviz falló).
+        """
+        opciones = opciones or OpcionesDiagrama()
+        clave = self._clave(automata, opciones)
+        destino = f"{nombre_archivo}.{opciones.formato}"
+        with self._candado:
+            render = self._en_curso.get(clave)
+            ruta = self._ruta(clave, opciones.formato)
+            if render is None and os.path.exists(ruta):
+                # Renderizado en una sesión anterior
+                render = Future()
+                render.set_result(ruta)
+                self._en_curso[clave] = render
+            elif render is None or (render.done() and render.exception() is not None):
+                fuente = construir_dot(automata, opciones).source
+                render = self._ejecutor.submit(self._renderizar, fuente, clave, opciones)
+                self._en_curso[clave] = render
+
+        resultado: 'Future[str]' = Future()
+
+        def _copiar(render: Future):
+            try:
+                ruta = render.result()
+                if os.path.abspath(ruta) != os.path.abspath(destino):
+                    shutil.copyfile(ruta, destino)
+                resultado.set_result(destino)
+            except Exception as error:
+                resultado.set_exception(error)
+
+        # Si ya estaba renderizado, se copia en el acto
+        render.add_done_callback(_copiar)
+        return resultado
+
+    def cerrar(self, esperar: bool = True):
+        self._ejecutor.shutdown(wait=esperar)
@@ -0,0 +1,105 @@
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+from logica_automata import AFND, AFD, AFDCompilado, AFNDCompacto, AFNDIndexado
+
+
+# ============================================================
+# EQUIVALENCIA DE LENGUAJES (HOPCROFT–KARP)
+# ============================================================
+
+Automata = Union[AFND, AFD, AFDCompilado, AFNDIndexado, AFNDCompacto]
+
+
+class _VistaDeterminista:
+    """
+    Interfaz común sobre un AFD (estados enteros de la tabla compilada) o un
+    AFND (subconjuntos como máscaras, construidos al vuelo).
+    """
+
+    def __init__(self, automata: Automata):
+        if isinstance(automata, AFD):
+            automata = automata.compilar()
+        elif not isinstance(automata, AFDCompilado):
+            # AFND, AFNDCompacto o AFNDIndexado (que se devuelve a sí mismo)
+            automata = automata.indexar()
+        self.automata = automata
+        self.es_afd = isinstance(automata, AFDCompilado)
+        self.inicial = automata.inicial
+        self.simbolos = set(automata.simbolos)
+
+    def paso(self, estado: int, simbolo: str) -> int:
+        a = self.automata
+        if self.es_afd:
+            c = a.columna.get(simbolo)
+            return a.muerto if c is None else a.tabla[estado * a.ancho + c]
+        s = a.indice_simbolo.get(simbolo)
+        return 0 if s is None else a.mover(estado, s)
+
+    def acepta(self, estado: int) -> bool:
+        if self.es_afd:
+            return self.automata.es_final(estado)
+        return bool(estado & self.automata.finales)
+
+
+def _buscar(padres: Dict[Hashable, Hashable], x: Hashable) -> Hashable:
+    raiz = x
+    while padres.get(raiz, raiz) != raiz:
+        raiz = padres[raiz]
+    # Compresión de caminos
+    while x != raiz:
+        padres[x], x = raiz, padres.get(x, x)
+    return raiz
+
+
+def _contraejemplo_mas_corto(a: _VistaDeterminista, b: _VistaDeterminista,
+                             simbolos: List[str]) -> Optional[str]:
+    """BFS sobre el producto: la primera pareja que discrepa da la cadena más corta"""
+    inicio = (a.inicial, b.inicial)
+    previo: Dict[Tuple[int, int], Optional[Tuple[Tuple[int, int], str]]] = {inicio: None}
+    cola = deque([inicio])
+    while cola:
+        par = cola.popleft()
+        p, q = par
+        if a.acepta(p) != b.acepta(q):
+            cadena = []
+            while previo[par] is not None:
+                par, simbolo = previo[par]
+                cadena.append(simbolo)
+            return ''.join(reversed(cadena))
+        for simbolo in simbolos:
+            siguiente = (a.paso(p, simbolo), b.paso(q, simbolo))
+            if siguiente not in previo:
+                previo[siguiente] = (par, simbolo)
+                cola.append(siguiente)
+    return None
+
+
+def verificar_equivalencia(a: Automata, b: Automata) -> Tuple[bool, Optional[str]]:
+    """
+    Decide si `a` y `b` (AFD o AFND, en cualquier combinación) aceptan el mismo
+    lenguaje. Usa el algoritmo de Hopcroft–Karp con unión-búsqueda, casi lineal
+    en el número de estados; si no son equivalentes devuelve además un
+    contraejemplo de longitud mínima (en orden lexicográfico de símbolos).
+    """
+    va, vb = _VistaDeterminista(a), _VistaDeterminista(b)
+    simbolos = sorted(va.simbolos | vb.simbolos)
+
+    padres: Dict[Hashable, Hashable] = {}
+    pila = [(va.inicial, vb.inicial)]
+    equivalentes = True
+    while pila:
+        p, q = pila.pop()
+        rp, rq = _buscar(padres, (0, p)), _buscar(padres, (1, q))
+        if rp == rq:
+            continue
+        if va.acepta(p) != vb.acepta(q):
+            equivalentes = False
+            break
+        padres[rp] = rq
+        for simbolo in simbolos:
+            pila.append((va.paso(p, simbolo), vb.paso(q, simbolo)))
+
+    if equivalentes:
+        return True, None
+    return False, _contraejemplo_mas_corto(va, vb, simbolos)
@@ -0,0 +1,239 @@
+import mmap
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from logica_automata import AFD, AFDCompilado
+
+
+# ============================================================
+# ESCÁNER: TODAS LAS COINCIDENCIAS DE UN AFD EN UN TEXTO
+# ============================================================
+
+Coincidencia = Tuple[int, int]  # (desplazamiento, longitud)
+
+
+# Posiciones de inicio pendientes de decidir, como máximo, en el escáner
+MAX_ANTICIPACION = 1 << 16
+
+
+class _Grupo:
+    """
+    Nodo de union-find sobre posiciones de inicio. Los hilos que llegan al
+    mismo estado del AFD tienen el mismo futuro y se unen bajo un nodo nuevo;
+    `fin` es el último final alcanzado mientras el nodo era raíz y `vivo`
+    (válido solo en la raíz) indica si el hilo aún puede llegar a un final.
+    """
+
+    __slots__ = ('padre', 'fin', 'vivo')
+
+    def __init__(self):
+        self.padre: Optional['_Grupo'] = None
+        self.fin = -1
+        self.vivo = True
+
+
+def _unir(a: _Grupo, b: _Grupo) -> _Grupo:
+    # Raíz nueva: los finales que vengan después valen para ambos, los anteriores no
+    raiz = _Grupo()
+    a.padre = b.padre = raiz
+    return raiz
+
+
+def _consultar(nodo: _Grupo) -> Tuple[int, bool]:
+    """(fin más largo, sigue vivo) de una posición de inicio; comprime el camino"""
+    camino = []
+    while nodo.padre is not None:
+        camino.append(nodo)
+        nodo = nodo.padre
+    maximo = -1
+    for x in reversed(camino):
+        # Los nodos internos ya no cambian: se guarda el máximo hasta la raíz
+        if x.fin > maximo:
+            maximo = x.fin
+        x.fin = maximo
+        x.padre = nodo
+    return max(maximo, nodo.fin), nodo.vivo
+
+
+class Escaner:
+    """
+    Busca las subcadenas (no vacías y sin solaparse) que el AFD acepta, con
+    semántica leftmost-longest: entre las coincidencias gana la que empieza
+    antes y, a igual inicio, la más larga; la búsqueda sigue después de su
+    final.
+
+    Cada carácter se lee una sola vez. En cada posición se lanza un hilo desde
+    el estado inicial; los hilos en el mismo estado del AFD tienen el mismo
+    futuro, así que se unen en un grupo (nunca hay más grupos que estados) y
+    cada posición de inicio conserva, vía union-find, el final más largo que
+    alcanzó. La coincidencia que empieza en la posición de búsqueda se decide
+    cuando su hilo muere; si sigue vivo tras `max_anticipacion` caracteres se
+    da por terminado, así que una coincidencia más larga que eso se corta en el
+    último final visto. El estado se conserva entre llamadas a `alimentar`, por
+    lo que el texto puede llegar en bloques.
+    """
+
+    def __init__(self, afd: Union[AFD, AFDCompilado], max_anticipacion: int = MAX_ANTICIPACION):
+        if max_anticipacion < 1:
+            raise ValueError("max_anticipacion debe ser al menos 1")
+        c = afd.compilar() if isinstance(afd, AFD) else afd
+        self.compilado = c
+        self.max_anticipacion = max_anticipacion
+        n_simbolos = len(c.simbolos)
+        self._filas = [[c.tabla[q * c.ancho + s] for s in range(n_simbolos)]
+                       for q in range(c.muerto + 1)]
+        self._utiles = self._coalcanzables()
+        self._finales = [c.es_final(q) for q in range(c.muerto + 1)]
+        # Columnas por byte, solo si todos los símbolos son ASCII de un carácter
+        self._columnas_bytes: Optional[List[Optional[int]]] = None
+        if all(len(s) == 1 and ord(s) < 128 for s in c.simbolos):
+            self._columnas_bytes = [None] * 256
+            for s, col in c.columna.items():
+                self._columnas_bytes[ord(s)] = col
+        self.reiniciar()
+
+    def _coalcanzables(self) -> List[bool]:
+        c = self.compilado
+        inversas: Dict[int, List[int]] = {}
+        for q, fila in enumerate(self._filas):
+            for d in fila:
+                inversas.setdefault(d, []).append(q)
+        utiles = [False] * (c.muerto + 1)
+        pila = [q for q in range(c.muerto) if c.es_final(q)]
+        for q in pila:
+            utiles[q] = True
+        while pila:
+            for p in inversas.get(pila.pop(), ()):
+                if not utiles[p]:
+                    utiles[p] = True
+                    pila.append(p)
+        return utiles
+
+    def reiniciar(self):
+        self.posicion = 0
+        self._grupos: Dict[int, _Grupo] = {}     # estado → grupo de hilos
+        # Nodo de cada posición de inicio desde `_busqueda` (la próxima a decidir)
+        self._inicios: Deque[_Grupo] = deque()
+        self._busqueda = 0
+
+    def _decidir(self, salida: List[Coincidencia], fin_de_texto: bool = False):
+        """Emite las coincidencias que ya son definitivas desde la posición de búsqueda"""
+        inicios = self._inicios
+        while inicios:
+            inicio = self._busqueda
+            fin, vivo = _consultar(inicios[0])
+            if vivo and not fin_de_texto and self.posicion - inicio < self.max_anticipacion:
+                return
+            if fin > inicio:
+                salida.append((inicio, fin - inicio))
+                siguiente = fin
+            else:
+                siguiente = inicio + 1
+            for _ in range(siguiente - inicio):
+                inicios.popleft()
+            self._busqueda = siguiente
+
+    def _procesar(self, columnas: Iterable[Optional[int]], salida: List[Coincidencia]):
+        inicial = self.compilado.inicial
+        filas, utiles, finales = self._filas, self._utiles, self._finales
+        inicios = self._inicios
+        arranca = utiles[inicial]
+        fila_inicial = filas[inicial]
+        posicion = self.posicion
+        grupos = self._grupos
+        for col in columnas:
+            if not inicios and (col is None or not utiles[fila_inicial[col]]):
+                # Nada pendiente y el hilo nuevo muere enseguida: solo se avanza
+                posicion += 1
+                self.posicion = self._busqueda = posicion
+                continue
+            if not inicios and grupos:
+                # Hilos de inicios ya descartados (dentro de una coincidencia emitida)
+                grupos = {}
+            murio = not arranca
+            nodo = _Grupo()
+            inicios.append(nodo)
+            if not arranca:
+                nodo.vivo = False
+            else:
+                previo = grupos.get(inicial)
+                grupos[inicial] = nodo if previo is None else _unir(previo, nodo)
+            posicion += 1
+            nuevos: Dict[int, _Grupo] = {}
+            if col is None:
+                for grupo in grupos.values():
+                    grupo.vivo = False
+                    murio = True
+            else:
+                for q, grupo in grupos.items():
+                    d = filas[q][col]
+                    if not utiles[d]:
+                        grupo.vivo = False
+                        murio = True
+                        continue
+                    previo = nuevos.get(d)
+                    nuevos[d] = grupo if previo is None else _unir(previo, grupo)
+                for d, grupo in nuevos.items():
+                    if finales[d]:
+                        grupo.fin = posicion
+            grupos = nuevos
+            self._grupos = grupos
+            self.posicion = posicion
+            # Solo hay algo nuevo que decidir si murió un hilo o se agotó la anticipación
+            if murio or posicion - self._busqueda >= self.max_anticipacion:
+                self._decidir(salida)
+
+    def alimentar(self, bloque: Union[str, bytes]) -> List[Coincidencia]:
+        """Procesa el siguiente bloque y devuelve las coincidencias ya definitivas"""
+        if isinstance(bloque, (bytes, bytearray, memoryview)):
+            if self._columnas_bytes is None:
+                raise ValueError("El escaneo por bytes requiere un alfabeto ASCII de un carácter")
+            columnas = self._columnas_bytes
+            simbolos = (columnas[b] for b in bloque)
+        else:
+            columna = self.compilado.columna
+            simbolos = (columna.get(ch) for ch in bloque)
+        salida: List[Coincidencia] = []
+        self._procesar(simbolos, salida)
+        return salida
+
+    def finalizar(self) -> List[Coincidencia]:
+        """Fin del texto: emite las coincidencias pendientes y reinicia"""
+        salida: List[Coincidencia] = []
+        self._decidir(salida, fin_de_texto=True)
+        self.reiniciar()
+        return salida
+
+
+def escanear_texto(afd: Union[AFD, AFDCompilado], texto: str) -> List[Coincidencia]:
+    escaner = Escaner(afd)
+    return escaner.alimentar(texto) + escaner.finalizar()
+
+
+def escanear_archivo(afd: Union[AFD, AFDCompilado], ruta: str,
+                     tam_bloque: int = 1 << 20) -> Iterator[Coincidencia]:
+    """
+    Recorre el archivo una sola vez y va entregando las coincidencias.
+    Con un alfabeto ASCII el archivo se mapea en memoria y los desplazamientos
+    son en bytes; si no, se lee como texto UTF-8 por bloques y los
+    desplazamientos son en caracteres.
+    """
+    escaner = Escaner(afd)
+    if escaner._columnas_bytes is not None:
+        with open(ruta, 'rb') as f:
+            try:
+                mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Archivo vacío: no se puede mapear
+                return
+            with mapa:
+                for inicio in range(0, len(mapa), tam_bloque):
+                    yield from escaner.alimentar(mapa[inicio:inicio + tam_bloque])
+    else:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            while True:
+                bloque = f.read(tam_bloque)
+                if not bloque:
+                    break
+                yield from escaner.alimentar(bloque)
+    yield from escaner.finalizar()
@@ -0,0 +1,92 @@
+import time
+from typing import Iterator, List, Optional, Sequence, Union
+
+from logica_automata import AFND, AFD, AFDCompilado
+
+
+# ============================================================
+# EVALUACIÓN EN FLUJO DE ARCHIVOS GRANDES
+# ============================================================
+
+class ResumenEvaluacion:
+    """Conteo acumulado de una evaluación en flujo"""
+
+    def __init__(self):
+        self.aceptadas = 0
+        self.rechazadas = 0
+        self.segundos = 0.0
+
+    @property
+    def total(self) -> int:
+        return self.aceptadas + self.rechazadas
+
+    @property
+    def lineas_por_segundo(self) -> float:
+        return self.total / self.segundos if self.segundos > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.total} cadenas: {self.aceptadas} aceptadas, "
+                f"{self.rechazadas} rechazadas en {self.segundos:.2f} s "
+                f"({self.lineas_por_segundo:,.0f} líneas/s)")
+
+
+# Tope de caracteres por lote: unas pocas líneas muy largas no agrandan el lote
+MAX_CARACTERES_LOTE = 1 << 22
+
+
+# Lee el archivo línea a línea y entrega lotes acotados en líneas y en caracteres
+def leer_lotes(ruta: str, tam_lote: int = 10000,
+               max_caracteres: int = MAX_CARACTERES_LOTE) -> Iterator[List[str]]:
+    lote = []
+    caracteres = 0
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            cadena = linea.strip()
+            if not cadena:
+                continue
+            lote.append(cadena)
+            caracteres += len(cadena)
+            if len(lote) >= tam_lote or caracteres >= max_caracteres:
+                yield lote
+                lote = []
+                caracteres = 0
+    if lote:
+        yield lote
+
+
+def evaluar_bloque(automata: Union[AFND, AFD, AFDCompilado],
+                   cadenas: List[str]) -> Sequence[bool]:
+    if isinstance(automata, (AFD, AFDCompilado)):
+        return automata.evaluar_lote(cadenas)
+    return [automata.evaluar_cadena(c) for c in cadenas]
+
+
+def evaluar_archivo(automata: Union[AFND, AFD], ruta: str,
+                    ruta_salida: Optional[str] = None,
+                    tam_lote: int = 10000,
+                    max_caracteres: int = MAX_CARACTERES_LOTE) -> ResumenEvaluacion:
+    """
+    Evalúa cada línea no vacía de `ruta` sin cargar el archivo completo.
+    La memoria usada depende de `tam_lote` y `max_caracteres` (y de la línea
+    más larga, que se lee entera). Si se indica `ruta_salida`, escribe una
+    línea `cadena<TAB>ACEPTADA|RECHAZADA` por cadena.
+    """
+    resumen = ResumenEvaluacion()
+    inicio = time.perf_counter()
+    salida = open(ruta_salida, 'w', encoding='utf-8') if ruta_salida else None
+    try:
+        for lote in leer_lotes(ruta, tam_lote, max_caracteres):
+            resultados = evaluar_bloque(automata, lote)
+            aceptadas = int(sum(resultados))
+            resumen.aceptadas += aceptadas
+            resumen.rechazadas += len(lote) - aceptadas
+            if salida:
+                salida.writelines(
+                    f"{c}\t{'ACEPTADA' if ok else 'RECHAZADA'}\n"
+                    for c, ok in zip(lote, resultados)
+                )
+    finally:
+        if salida:
+            salida.close()
+    resumen.segundos = time.perf_counter() - inicio
+    return resumen
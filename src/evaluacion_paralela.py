@@ -0,0 +1,112 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+from logica_automata import AFND, AFD
+from evaluacion_flujo import MAX_CARACTERES_LOTE, ResumenEvaluacion, evaluar_bloque
+
+
+# ============================================================
+# EVALUACIÓN PARALELA POR FRAGMENTOS DE ARCHIVO
+# ============================================================
+
+# Autómata de cada proceso trabajador (se recibe una sola vez en el inicializador)
+_automata = None
+
+
+def _inicializar_trabajador(automata):
+    global _automata
+    _automata = automata
+
+
+def _evaluar_fragmento(ruta: str, inicio: int, fin: int, tam_lote: int, max_caracteres: int,
+                       conservar: bool) -> Tuple[int, int, Optional[List[bool]]]:
+    """
+    Evalúa las líneas que *empiezan* en el rango de bytes [inicio, fin).
+    La línea cortada al inicio del rango pertenece al fragmento anterior.
+    """
+    aceptadas = rechazadas = 0
+    resultados = [] if conservar else None
+    lote = []
+    caracteres = 0
+
+    def _procesar():
+        nonlocal aceptadas, rechazadas, caracteres
+        r = evaluar_bloque(_automata, lote)
+        n = int(sum(r))
+        aceptadas += n
+        rechazadas += len(lote) - n
+        if conservar:
+            resultados.extend(bool(x) for x in r)
+        lote.clear()
+        caracteres = 0
+
+    with open(ruta, 'rb') as f:
+        if inicio > 0:
+            f.seek(inicio - 1)
+            f.readline()
+        posicion = f.tell()
+        while posicion < fin:
+            linea = f.readline()
+            if not linea:
+                break
+            posicion += len(linea)
+            cadena = linea.decode('utf-8').strip()
+            if not cadena:
+                continue
+            lote.append(cadena)
+            caracteres += len(cadena)
+            if len(lote) >= tam_lote or caracteres >= max_caracteres:
+                _procesar()
+    if lote:
+        _procesar()
+    return aceptadas, rechazadas, resultados
+
+
+def fragmentar(ruta: str, tam_fragmento: int) -> List[Tuple[int, int]]:
+    tam = os.path.getsize(ruta)
+    return [(i, min(i + tam_fragmento, tam)) for i in range(0, tam, tam_fragmento)]
+
+
+def evaluar_archivo_paralelo(automata: Union[AFND, AFD], ruta: str,
+                             trabajadores: Optional[int] = None,
+                             tam_fragmento: int = 32 * 1024 * 1024,
+                             tam_lote: int = 10000,
+                             conservar_resultados: bool = False,
+                             max_caracteres: int = MAX_CARACTERES_LOTE
+                             ) -> Tuple[ResumenEvaluacion, Optional[List[bool]]]:
+    """
+    Divide el archivo en fragmentos de `tam_fragmento` bytes y los evalúa en
+    `trabajadores` procesos. Un AFD se envía ya compilado. Si
+    `conservar_resultados` es True, devuelve además los resultados en el orden
+    del archivo; si no, solo los conteos.
+    """
+    if isinstance(automata, AFD):
+        automata = automata.compilar()
+    trabajadores = trabajadores or os.cpu_count() or 1
+    fragmentos = fragmentar(ruta, tam_fragmento)
+
+    resumen = ResumenEvaluacion()
+    resultados = [] if conservar_resultados else None
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=trabajadores,
+                             initializer=_inicializar_trabajador,
+                             initargs=(automata,)) as ejecutor:
+        parciales = ejecutor.map(
+            _evaluar_fragmento,
+            [ruta] * len(fragmentos),
+            [a for a, _ in fragmentos],
+            [b for _, b in fragmentos],
+            [tam_lote] * len(fragmentos),
+            [max_caracteres] * len(fragmentos),
+            [conservar_resultados] * len(fragmentos),
+        )
+        # map respeta el orden de los fragmentos
+        for aceptadas, rechazadas, parcial in parciales:
+            resumen.aceptadas += aceptadas
+            resumen.rechazadas += rechazadas
+            if conservar_resultados:
+                resultados.extend(parcial)
+    resumen.segundos = time.perf_counter() - inicio
+    return resumen, resultados
@@ -1,16 +1,30 @@
 from logica_automata import (
-    AFND, AFD, ConversorAFNDaAFD, crear_afnd_desde_dict,
+    AFND, AFD, ConversorAFNDaAFD, EPSILON, crear_afnd_desde_dict,
     guardar_afnd_en_json, cargar_afnd_desde_json
 )
+from evaluacion_flujo import evaluar_archivo
+from equivalencia import verificar_equivalencia
+from lenguaje import contar_aceptadas, enumerar_aceptadas
+from diagramas import OpcionesDiagrama, RenderizadorDiagramas
+from itertools import islice
 import os
 from typing import List
 
 
 class InterfazInteractiva:
+    # Los diagramas de autómatas con más estados piden opciones de nivel de detalle
+    UMBRAL_DETALLE = 100
+
     def __init__(self):
         self.afnd = None
         self.afd = None
+        self.renderizador = RenderizadorDiagramas()
+        # Mensajes de los diagramas terminados en segundo plano
+        self.avisos: List[str] = []
+
     def mostrar_menu_principal(self):
+        while self.avisos:
+            print(self.avisos.pop(0))
         print("\n" + "="*60)
         print(" TAREA: CONVERSOR AFND → AFD")
         print("="*60)
@@ -59,7 +73,8 @@ class InterfazInteractiva:
                 return
 
             print("\n--- TRANSICIONES ---")
-            print("Formato: origen,simbolo,destino1,destino2,... (Enter vacío para terminar)\n")
+            print("Formato: origen,simbolo,destino1,destino2,... (Enter vacío para terminar)")
+            print(f"Use '{EPSILON}' como símbolo para las transiciones vacías\n")
 
             transiciones_dict = {}
 
@@ -76,7 +91,7 @@ class InterfazInteractiva:
                 origen, simbolo = partes[0], partes[1]
                 destinos = [d for d in partes[2:] if d]
 
-                if origen not in estados or simbolo not in alfabeto:
+                if origen not in estados or (simbolo not in alfabeto and simbolo != EPSILON):
                     print(f"  ✗ Error en origen o símbolo no válido.")
                     continue
 
@@ -133,7 +148,7 @@ class InterfazInteractiva:
             print("✗ Primero debe crear o cargar un AFND (Opción 1 o 9)")
             return
         nombre = input("Nombre del archivo AFND (sin extensión): ").strip() or "afnd"
-        self.afnd.diagramar(nombre)
+        self._diagramar(self.afnd, nombre, "AFND")
 
     # ============================================================
     # 4. CONVERSIÓN AFND → AFD
@@ -142,8 +157,21 @@ class InterfazInteractiva:
         if not self.afnd:
             print("✗ Primero debe crear o cargar un AFND (Opción 1 o 9)")
             return
-        self.afd = ConversorAFNDaAFD.convertir(self.afnd)
-        print("\n✓ Conversión a AFD completada.")
+        minimizar = input("¿Minimizar el AFD resultante? (s/N): ").strip().lower() == 's'
+
+        def _progreso(stats):
+            print(f"  ... {stats.estados_procesados} estados procesados, "
+                  f"{stats.profundidad_cola} en cola, "
+                  f"{stats.transiciones_por_segundo:,.0f} transiciones/s")
+
+        print("\nConvirtiendo AFND a AFD...")
+        self.afd, stats = ConversorAFNDaAFD.convertir_con_estadisticas(
+            self.afnd, minimizar=minimizar, progreso=_progreso, intervalo_progreso=10000)
+        print(f"\n✓ Conversión a AFD completada: {stats}")
+        print(f"  Estado inicial AFD: {self.afd.estado_inicial}")
+        if minimizar:
+            print(f"  Minimización: {stats.estados_eliminados} estados eliminados "
+                  f"({len(self.afd.estados)} restantes)")
 
     # ============================================================
     # 5. DIAGRAMA AFD
@@ -153,7 +181,30 @@ class InterfazInteractiva:
             print("✗ Primero debe convertir el AFND a AFD (Opción 4)")
             return
         nombre = input("Nombre del archivo AFD (sin extensión): ").strip() or "afd"
-        self.afd.diagramar(nombre)
+        self._diagramar(self.afd, nombre, "AFD")
+
+    def _diagramar(self, automata, nombre: str, tipo: str):
+        formato = input("Formato (png/svg) [png]: ").strip().lower() or "png"
+        if formato not in ("png", "svg"):
+            print("✗ Formato inválido")
+            return
+        opciones = OpcionesDiagrama(formato=formato)
+        if len(automata.estados) > self.UMBRAL_DETALLE:
+            print(f"  El autómata tiene {len(automata.estados)} estados.")
+            opciones.ocultar_sumidero = input("  ¿Ocultar estados sumidero (∅)? (S/n): ").strip().lower() != 'n'
+            vecindad = input("  Mostrar solo hasta k transiciones del inicial (Enter = todo): ").strip()
+            if vecindad.isdigit():
+                opciones.vecindad = int(vecindad)
+            opciones.motor = input("  Motor de graphviz [sfdp]: ").strip() or "sfdp"
+
+        def _terminado(futuro):
+            try:
+                self.avisos.append(f"\n✓ Diagrama {tipo} generado: {futuro.result()}")
+            except Exception as error:
+                self.avisos.append(f"\n✗ No se pudo generar el diagrama {tipo}: {error}")
+
+        self.renderizador.solicitar(automata, nombre, opciones).add_done_callback(_terminado)
+        print(f"\n⏳ Diagrama {tipo} en preparación; se avisará al terminar.")
 
     # ============================================================
     # 6. EVALUAR CADENAS
@@ -167,6 +218,7 @@ class InterfazInteractiva:
         print("1. Ingresar cadenas manualmente")
         print("2. Generar cadenas de prueba automáticamente")
         print("3. Cargar cadenas desde archivo (.txt)")
+        print("4. Generar solo cadenas aceptadas (requiere AFD)")
         opcion = input("\nSeleccione opción: ").strip()
 
         cadenas = []
@@ -179,7 +231,7 @@ class InterfazInteractiva:
                 cadenas.append(s)
         elif opcion == '2':
             alfabeto = list(self.afnd.alfabeto if self.afnd else self.afd.alfabeto)
-            alfabeto = [x for x in alfabeto if x not in ('ε', '')]
+            alfabeto = [x for x in alfabeto if x not in (EPSILON, '')]
             try:
                 longitud_max = int(input("Longitud máxima (default 3): ").strip() or "3")
             except ValueError:
@@ -188,13 +240,22 @@ class InterfazInteractiva:
             print(f"\nGeneradas {len(cadenas)} cadenas de prueba")
         elif opcion == '3':
             archivo = input("Archivo (.txt): ").strip()
+            salida = input("Archivo de resultados (Enter para solo ver el resumen): ").strip()
+            # El archivo se procesa en flujo: con ambos autómatas basta el AFD
+            automata = self.afd if self.afd else self.afnd
+            nombre = "AFD" if self.afd else "AFND"
             try:
-                with open(archivo, 'r', encoding='utf-8') as f:
-                    cadenas = [line.strip() for line in f if line.strip()]
-                print(f"\nCargadas {len(cadenas)} cadenas desde {archivo}")
+                resumen = evaluar_archivo(automata, archivo, salida or None)
             except Exception as e:
                 print(f"✗ Error al leer archivo: {e}")
                 return
+            print(f"\nEvaluado en {nombre}: {resumen}")
+            if salida:
+                print(f"✓ Resultados guardados en '{salida}'")
+            return
+        elif opcion == '4':
+            self.generar_cadenas_aceptadas()
+            return
         else:
             print("\n✗ Opción inválida")
             return
@@ -206,8 +267,11 @@ class InterfazInteractiva:
         def _eval(automata, nombre):
             print(f"\nEvaluando en {nombre}...")
             print("-"*40)
-            for cadena in cadenas:
-                ok = automata.evaluar_cadena(cadena)
+            if isinstance(automata, AFD):
+                resultados = automata.evaluar_lote(cadenas)
+            else:
+                resultados = [automata.evaluar_cadena(c) for c in cadenas]
+            for cadena, ok in zip(cadenas, resultados):
                 print(f"  '{cadena if cadena != '' else 'ε'}' → {'ACEPTADA' if ok else 'RECHAZADA'}")
 
         if self.afnd and self.afd:
@@ -215,9 +279,9 @@ class InterfazInteractiva:
             print("{:<15} {:<12} {:<12} {:<8}".format("Cadena", "AFND", "AFD", "Coincide"))
             print("-"*52)
             todo_ok = True
-            for c in cadenas:
+            resultados_afd = self.afd.evaluar_lote(cadenas)
+            for c, r2 in zip(cadenas, resultados_afd):
                 r1 = self.afnd.evaluar_cadena(c)
-                r2 = self.afd.evaluar_cadena(c)
                 coincide = (r1 == r2)
                 if not coincide:
                     todo_ok = False
@@ -231,6 +295,13 @@ class InterfazInteractiva:
                 print("\n✓ Ambos autómatas coinciden en todas las cadenas.")
             else:
                 print("\n✗ Diferencias detectadas entre AFND y AFD.")
+            # Verificación exacta sobre los autómatas, no solo sobre estas cadenas
+            equivalentes, contraejemplo = verificar_equivalencia(self.afnd, self.afd)
+            if equivalentes:
+                print("✓ Verificación exacta: AFND y AFD reconocen el mismo lenguaje.")
+            else:
+                print(f"✗ Verificación exacta: los lenguajes difieren; contraejemplo más corto: "
+                      f"'{contraejemplo if contraejemplo != '' else 'ε'}'")
         elif self.afnd:
             _eval(self.afnd, "AFND")
         elif self.afd:
@@ -247,6 +318,28 @@ class InterfazInteractiva:
                 cadenas.append(''.join(comb))
         return cadenas
 
+    # Recorre el AFD en orden shortlex sin generar las cadenas rechazadas
+    def generar_cadenas_aceptadas(self):
+        if not self.afd:
+            print("✗ Primero debe convertir el AFND a AFD (Opción 4)")
+            return
+        try:
+            longitud_max = int(input("Longitud máxima (default 5): ").strip() or "5")
+            cantidad = int(input("Cantidad máxima a mostrar (default 50): ").strip() or "50")
+        except ValueError:
+            print("✗ Debe ingresar números enteros.")
+            return
+
+        conteos = contar_aceptadas(self.afd, longitud_max)
+        print("\nCadenas aceptadas por longitud:")
+        for L, n in enumerate(conteos):
+            print(f"  {L:>3}: {n}")
+        print(f"  Total: {sum(conteos)}")
+
+        print(f"\nPrimeras {cantidad} cadenas aceptadas:")
+        for cadena in islice(enumerar_aceptadas(self.afd, longitud_max), cantidad):
+            print(f"  '{cadena if cadena != '' else 'ε'}'")
+
     # ============================================================
     # 7. ESTADO ACTUAL
     # ============================================================
@@ -303,6 +396,7 @@ class InterfazInteractiva:
 
             if opcion == '0':
                 print("\n¡Hasta luego!")
+                self.renderizador.cerrar()
                 break
             elif opcion == '1':
                 self.crear_afnd_manual()
@@ -0,0 +1,165 @@
+from typing import Iterator, List, Optional, Union
+
+from logica_automata import AFD, AFDCompilado
+
+
+# ============================================================
+# ENUMERACIÓN Y CONTEO DEL LENGUAJE ACEPTADO POR UN AFD
+# ============================================================
+
+def _compilado(afd: Union[AFD, AFDCompilado]) -> AFDCompilado:
+    return afd.compilar() if isinstance(afd, AFD) else afd
+
+
+def _utiles(c: AFDCompilado) -> List[int]:
+    """Estados alcanzables desde el inicial que además pueden llegar a un final"""
+    n_simbolos = len(c.simbolos)
+    alcanzables = [c.inicial]
+    visto = {c.inicial}
+    inversas = {}
+    for q in alcanzables:
+        for s in range(n_simbolos):
+            d = c.tabla[q * c.ancho + s]
+            inversas.setdefault(d, []).append(q)
+            if d not in visto:
+                visto.add(d)
+                alcanzables.append(d)
+    pila = [q for q in alcanzables if c.es_final(q)]
+    coalcanzables = set(pila)
+    while pila:
+        for p in inversas.get(pila.pop(), ()):
+            if p not in coalcanzables:
+                coalcanzables.add(p)
+                pila.append(p)
+    return [q for q in alcanzables if q in coalcanzables]
+
+
+def _tiene_ciclo(c: AFDCompilado, utiles: List[int]) -> bool:
+    conjunto = set(utiles)
+    color = {}
+    for raiz in utiles:
+        if raiz in color:
+            continue
+        color[raiz] = 1
+        pila = [(raiz, 0)]
+        while pila:
+            q, s = pila.pop()
+            if s == len(c.simbolos):
+                color[q] = 2
+                continue
+            pila.append((q, s + 1))
+            d = c.tabla[q * c.ancho + s]
+            if d not in conjunto:
+                continue
+            if color.get(d) == 1:
+                return True
+            if d not in color:
+                color[d] = 1
+                pila.append((d, 0))
+    return False
+
+
+def enumerar_aceptadas(afd: Union[AFD, AFDCompilado],
+                       longitud_max: Optional[int] = None) -> Iterator[str]:
+    """
+    Genera las cadenas aceptadas en orden shortlex (por longitud y luego
+    lexicográfico según el orden de los símbolos), de forma perezosa.
+
+    Para cada longitud L se conoce, por programación dinámica, el conjunto de
+    estados desde los que se acepta alguna cadena de exactamente r símbolos;
+    el recorrido solo entra en ramas que producen al menos una cadena, así que
+    el trabajo es proporcional a lo que se genera. Si el lenguaje es finito,
+    el generador termina solo aunque no se indique `longitud_max`.
+    """
+    c = _compilado(afd)
+    utiles = _utiles(c)
+    if not utiles:
+        return
+    if longitud_max is None and not _tiene_ciclo(c, utiles):
+        # Lenguaje finito: ninguna cadena aceptada es más larga que los estados útiles
+        longitud_max = len(utiles)
+
+    n_simbolos = len(c.simbolos)
+    filas = [[c.tabla[q * c.ancho + s] for s in range(n_simbolos)] for q in range(c.muerto + 1)]
+    # vivos[r] = máscara de estados que aceptan alguna cadena de longitud exactamente r
+    vivos = [sum(1 << q for q in utiles if c.es_final(q))]
+
+    L = 0
+    while longitud_max is None or L <= longitud_max:
+        while len(vivos) <= L:
+            anterior = vivos[-1]
+            vivos.append(sum(1 << q for q in utiles
+                             if any((anterior >> d) & 1 for d in filas[q])))
+        if (vivos[L] >> c.inicial) & 1:
+            # (estado, próximo símbolo a probar, prefijo, símbolos en el prefijo):
+            # un símbolo puede tener varios caracteres
+            pila = [(c.inicial, 0, '', 0)]
+            while pila:
+                q, s, prefijo, largo = pila.pop()
+                if largo == L:
+                    yield prefijo
+                    continue
+                if s == n_simbolos:
+                    continue
+                # Primero el resto de símbolos (se procesa después), luego la rama actual
+                pila.append((q, s + 1, prefijo, largo))
+                d = filas[q][s]
+                if (vivos[L - largo - 1] >> d) & 1:
+                    pila.append((d, 0, prefijo + c.simbolos[s], largo + 1))
+        L += 1
+
+
+def contar_aceptadas(afd: Union[AFD, AFDCompilado], longitud_max: int) -> List[int]:
+    """Cantidad de cadenas aceptadas de cada longitud 0..longitud_max, sin enumerarlas"""
+    c = _compilado(afd)
+    n_simbolos = len(c.simbolos)
+    finales = [q for q in range(c.muerto) if c.es_final(q)]
+    actual = {c.inicial: 1}
+    conteos = []
+    for _ in range(longitud_max + 1):
+        conteos.append(sum(actual.get(q, 0) for q in finales))
+        siguiente = {}
+        for q, cantidad in actual.items():
+            if q == c.muerto:
+                continue
+            base = q * c.ancho
+            for s in range(n_simbolos):
+                d = c.tabla[base + s]
+                siguiente[d] = siguiente.get(d, 0) + cantidad
+        actual = siguiente
+    return conteos
+
+
+def contar_longitud(afd: Union[AFD, AFDCompilado], longitud: int) -> int:
+    """
+    Cantidad de cadenas aceptadas de exactamente `longitud` símbolos, elevando
+    la matriz de transiciones por cuadrados sucesivos (O(n³·log L)); conviene
+    para longitudes muy grandes con pocos estados.
+    """
+    c = _compilado(afd)
+    utiles = _utiles(c)
+    if not utiles:
+        return 0
+    indice = {q: i for i, q in enumerate(utiles)}
+    n = len(utiles)
+    matriz = [[0] * n for _ in range(n)]
+    for q in utiles:
+        for s in range(len(c.simbolos)):
+            d = c.tabla[q * c.ancho + s]
+            if d in indice:
+                matriz[indice[q]][indice[d]] += 1
+
+    def _multiplicar(a, b):
+        columnas = list(zip(*b))
+        return [[sum(x * y for x, y in zip(fila, col)) for col in columnas] for fila in a]
+
+    # vector fila del estado inicial multiplicado por matriz^longitud
+    vector = [[1 if q == c.inicial else 0 for q in utiles]]
+    potencia = matriz
+    while longitud:
+        if longitud & 1:
+            vector = _multiplicar(vector, potencia)
+        longitud >>= 1
+        if longitud:
+            potencia = _multiplicar(potencia, potencia)
+    return sum(v for q, v in zip(utiles, vector[0]) if c.es_final(q))
@@ -1,8 +1,33 @@
 import graphviz
+import hashlib
 import json
+import numpy as np
 import os
-from typing import Set, Dict, List, Tuple, Optional, Union
-from collections import deque
+import pickle
+import sys
+import time
+from array import array
+from typing import Callable, Set, Dict, List, Tuple, Optional, Union
+from collections.abc import Sequence
+
+from diagramas import OpcionesDiagrama, construir_dot
+
+
+# Símbolo de las transiciones vacías
+EPSILON = 'ε'
+
+# Tope de las tablas por bloques de AFNDIndexado, en bits de máscaras guardadas
+MAX_BITS_TABLAS = 1 << 28
+
+
+def _diagramar(automata, nombre_archivo: str, opciones: Optional[OpcionesDiagrama],
+               tipo: str) -> graphviz.Digraph:
+    """Renderiza en el acto el DOT de diagramas.construir_dot (la interfaz lo hace en segundo plano)"""
+    opciones = opciones or OpcionesDiagrama()
+    dot = construir_dot(automata, opciones)
+    dot.render(nombre_archivo, format=opciones.formato, cleanup=True)
+    print(f"\n✓ Diagrama {tipo} generado: {nombre_archivo}.{opciones.formato}")
+    return dot
 
 
 # ============================================================
@@ -21,7 +46,32 @@ class AFND:
         self.transiciones = transiciones
         self.estado_inicial = estado_inicial
         self.estados_finales = estados_finales
+        self._indexado = None
         
+    # Representación entera (con ε-clausuras precalculadas); se construye una sola vez
+    def indexar(self) -> 'AFNDIndexado':
+        if self._indexado is None:
+            self._indexado = AFNDIndexado.desde_afnd(self)
+        return self._indexado
+
+    # Si se modifican las transiciones a mano, hay que descartar la caché
+    def invalidar_cache(self):
+        self._indexado = None
+
+    # Copia en arreglos int32 (ver AFNDCompacto); no se guarda en el objeto
+    def compactar(self) -> 'AFNDCompacto':
+        return AFNDCompacto.desde_afnd(self)
+
+    # Estados alcanzables usando solo transiciones ε
+    def clausura_epsilon(self, estados: Set[str]) -> Set[str]:
+        indexado = self.indexar()
+        mascara = 0
+        for estado in estados:
+            i = indexado.indice.get(estado)
+            if i is not None:
+                mascara |= 1 << i
+        return indexado.estados_de(indexado.clausura(mascara))
+
     # Revisa los conjuntos de transiciones
     def obtener_transicion(self, estado: str, simbolo: str) -> Set[str]:
         return self.transiciones.get((estado, simbolo), set())
@@ -33,15 +83,30 @@ class AFND:
             resultado.update(self.obtener_transicion(estado, simbolo))
         return resultado
 
-    # Chequea si la cadena es aceptada
+    # Chequea si la cadena es aceptada (simulación bit-paralela sobre máscaras)
     def evaluar_cadena(self, cadena: str) -> bool:
-        # Empieza en el estado inicial
-        estados_actuales = {self.estado_inicial}
+        return self.indexar().evaluar_cadena(cadena)
+
+    # ε-clausura recorriendo el diccionario de transiciones (sin máscaras)
+    def _clausura_conjuntos(self, estados: Set[str]) -> Set[str]:
+        clausura = set(estados)
+        pendientes = list(estados)
+        while pendientes:
+            for destino in self.obtener_transicion(pendientes.pop(), EPSILON):
+                if destino not in clausura:
+                    clausura.add(destino)
+                    pendientes.append(destino)
+        return clausura
+
+    # Simulación con conjuntos de nombres (referencia, no usa la versión indexada)
+    def evaluar_cadena_conjuntos(self, cadena: str) -> bool:
+        # Empieza en la ε-clausura del estado inicial
+        estados_actuales = self._clausura_conjuntos({self.estado_inicial})
         # Recorre cada símbolo de la cadena
         for simbolo in cadena:
-            if simbolo not in self.alfabeto:
+            if simbolo == EPSILON or simbolo not in self.alfabeto:
                 return False
-            estados_actuales = self.mover(estados_actuales, simbolo)
+            estados_actuales = self._clausura_conjuntos(self.mover(estados_actuales, simbolo))
             if not estados_actuales:
                 return False
         # Si alguno de los estados actuales es final, acepta
@@ -50,41 +115,20 @@ class AFND:
     # Verifica si el autómata es no determinista
     def validar_no_determinismo(self) -> Tuple[bool, str]:
         for (estado, simbolo), destinos in self.transiciones.items():
+            if simbolo == EPSILON and destinos:
+                return (True, f"Tiene transiciones vacías (δ({estado}, ε) = {destinos})")
             if len(destinos) > 1:
                 return (True, f"Tiene múltiples destinos (δ({estado}, {simbolo}) = {destinos})")
         for estado in self.estados:
-            for simbolo in self.alfabeto:
+            for simbolo in set(self.alfabeto) - {EPSILON}:
                 if (estado, simbolo) not in self.transiciones:
                     return (True, f"Transición faltante: δ({estado}, {simbolo}) no está definida")
         return (False, "El autómata ingresado es determinista")
 
     # Dibuja el diagrama del AFND
-    def diagramar(self, nombre_archivo: str = "afnd"):
-        dot = graphviz.Digraph(comment='AFND')
-        dot.attr(rankdir='LR')
-        dot.attr('node', shape='circle')
-        
-        for estado in self.estados:
-            if estado in self.estados_finales:
-                dot.node(estado, shape='doublecircle')
-            else:
-                dot.node(estado)
-        
-        dot.node('', shape='none')
-        dot.edge('', self.estado_inicial)
-        
-        transiciones_agrupadas = {}
-        for (origen, simbolo), destinos in self.transiciones.items():
-            for destino in destinos:
-                key = (origen, destino)
-                transiciones_agrupadas.setdefault(key, []).append(simbolo)
-        
-        for (origen, destino), simbolos in transiciones_agrupadas.items():
-            dot.edge(origen, destino, label=','.join(sorted(set(simbolos))))
-        
-        dot.render(nombre_archivo, format='png', cleanup=True)
-        print(f"\n✓ Diagrama AFND generado: {nombre_archivo}.png")
-        return dot
+    def diagramar(self, nombre_archivo: str = "afnd",
+                  opciones: Optional[OpcionesDiagrama] = None) -> graphviz.Digraph:
+        return _diagramar(self, nombre_archivo, opciones, "AFND")
 
 
 # ============================================================
@@ -100,12 +144,31 @@ class AFD:
         self.transiciones = transiciones
         self.estado_inicial = estado_inicial
         self.estados_finales = estados_finales
+        self._compilado = None
     
     def obtener_transicion(self, estado: str, simbolo: str) -> Optional[str]:
         return self.transiciones.get((estado, simbolo))
+
+    # Tabla entera equivalente; se construye una sola vez
+    def compilar(self) -> 'AFDCompilado':
+        if self._compilado is None:
+            self._compilado = AFDCompilado.desde_afd(self)
+        return self._compilado
+
+    # Si se modifican las transiciones a mano, hay que descartar la tabla compilada
+    def invalidar_cache(self):
+        self._compilado = None
     
     # Como solo hay un camino posible
     def evaluar_cadena(self, cadena: str) -> bool:
+        return self.compilar().evaluar_cadena(cadena)
+
+    # Evalúa muchas cadenas a la vez; devuelve un arreglo booleano
+    def evaluar_lote(self, cadenas: List[str]) -> np.ndarray:
+        return self.compilar().evaluar_lote(cadenas)
+
+    # Recorrido directo sobre el diccionario de transiciones (referencia)
+    def evaluar_cadena_diccionario(self, cadena: str) -> bool:
         estado_actual = self.estado_inicial
         for simbolo in cadena:
             if simbolo not in self.alfabeto:
@@ -115,87 +178,1092 @@ class AFD:
                 return False
         return estado_actual in self.estados_finales
 
-    def diagramar(self, nombre_archivo: str = "afd"):
-        dot = graphviz.Digraph(comment='AFD')
-        dot.attr(rankdir='LR')
-        dot.attr('node', shape='circle')
-        
-        for estado in self.estados:
-            if estado in self.estados_finales:
-                dot.node(estado, shape='doublecircle')
+    def minimizar(self) -> Tuple['AFD', int]:
+        """
+        Devuelve el AFD mínimo equivalente (algoritmo de Hopcroft) y cuántos
+        estados se eliminaron. Quita también los estados inalcanzables; cada
+        bloque toma el nombre de su estado de menor nombre.
+        """
+        c = self.compilar()
+        tabla, ancho = c.tabla, c.ancho
+        bloques, bloque_de = c._bloques_equivalentes()
+
+        # 3. AFD cociente; un bloque formado solo por el muerto no se materializa
+        nombre_bloque = {}
+        for b, miembros in enumerate(bloques):
+            reales = [c.nombres[q] for q in miembros if q != c.muerto]
+            if reales:
+                nombre_bloque[b] = min(reales)
+
+        transiciones = {}
+        for b, nombre in nombre_bloque.items():
+            q = next(iter(bloques[b]))
+            for s, simbolo in enumerate(c.simbolos):
+                destino = nombre_bloque.get(bloque_de[tabla[q * ancho + s]])
+                if destino is not None:
+                    transiciones[(nombre, simbolo)] = destino
+
+        estados = set(nombre_bloque.values())
+        estados_finales = {nombre_bloque[b] for b in nombre_bloque if c.es_final(next(iter(bloques[b])))}
+        inicial = nombre_bloque[bloque_de[c.inicial]]
+        minimo = AFD(estados, set(self.alfabeto), transiciones, inicial, estados_finales)
+        return minimo, len(self.estados) - len(estados)
+
+    def diagramar(self, nombre_archivo: str = "afd",
+                  opciones: Optional[OpcionesDiagrama] = None) -> graphviz.Digraph:
+        return _diagramar(self, nombre_archivo, opciones, "AFD")
+
+
+# ============================================================
+# NOMBRES DE ESTADO PEREZOSOS
+# ============================================================
+
+class NombresSubconjuntos(Sequence):
+    """
+    Nombres de los estados de una construcción por subconjuntos ("{q0,q1}"),
+    generados desde las máscaras solo al pedirlos (para mostrar o diagramar).
+    """
+
+    __slots__ = ('indexado', 'mascaras')
+
+    def __init__(self, indexado: 'AFNDIndexado', mascaras: List[int]):
+        self.indexado = indexado
+        self.mascaras = mascaras
+
+    def __len__(self) -> int:
+        return len(self.mascaras)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.indexado.nombre(m) for m in self.mascaras[i]]
+        return self.indexado.nombre(self.mascaras[i])
+
+
+class NombresSeleccionados(Sequence):
+    """Vista de `base` restringida a los índices dados, sin copiar los nombres"""
+
+    __slots__ = ('base', 'indices')
+
+    def __init__(self, base: Sequence, indices: List[int]):
+        self.base = base
+        self.indices = array('i', indices)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.base[j] for j in self.indices[i]]
+        return self.base[self.indices[i]]
+
+
+def _nombres_en_memoria(nombres: Sequence) -> bool:
+    """False si los nombres se leen de un buffer externo (p. ej. un mmap)"""
+    if isinstance(nombres, NombresSeleccionados):
+        return _nombres_en_memoria(nombres.base)
+    return isinstance(nombres, (list, tuple, NombresSubconjuntos))
+
+
+# ============================================================
+# AFD COMPILADO (tabla de transiciones entera)
+# ============================================================
+
+class AFDCompilado:
+    """
+    Forma compilada de un AFD: estados numerados 0..n-1, un estado muerto
+    explícito (n), tabla plana tabla[estado * ancho + columna] y un mapa de bits
+    de aceptación. Los nombres pueden ser cualquier secuencia (p. ej.
+    NombresSubconjuntos, que los genera solo al pedirlos).
+    """
+
+    __slots__ = ('nombres', 'simbolos', 'columna', 'ancho', 'tabla', 'inicial', 'muerto',
+                 'aceptacion', '_lote', '_mmap')
+
+    def __init__(self, nombres: Sequence, simbolos: List[str], tabla,
+                 inicial: int, aceptacion):
+        self.nombres = nombres
+        self.simbolos = simbolos
+        self.columna = {s: i for i, s in enumerate(simbolos)}
+        self.ancho = max(len(simbolos), 1)
+        self.tabla = tabla
+        self.inicial = inicial
+        self.muerto = len(nombres)
+        self.aceptacion = aceptacion
+        self._lote = None
+        # Mapeo de memoria del que salen tabla y aceptación, si lo hay
+        self._mmap = None
+
+    @classmethod
+    def desde_afd(cls, afd: 'AFD') -> 'AFDCompilado':
+        todos = set(afd.estados) | {afd.estado_inicial}
+        todos.update(afd.transiciones.values())
+        nombres = sorted(todos)
+        ids = {n: i for i, n in enumerate(nombres)}
+        simbolos = sorted(afd.alfabeto)
+        columna = {s: i for i, s in enumerate(simbolos)}
+        ancho = max(len(simbolos), 1)
+        muerto = len(nombres)
+
+        # Todo lo no definido (incluida la fila del estado muerto) va al muerto
+        tabla = array('i', [muerto]) * ((muerto + 1) * ancho)
+        for (origen, simbolo), destino in afd.transiciones.items():
+            c = columna.get(simbolo)
+            if c is None or origen not in ids:
+                continue
+            tabla[ids[origen] * ancho + c] = ids[destino]
+
+        aceptacion = bytearray((muerto + 1 + 7) // 8)
+        for f in afd.estados_finales:
+            if f in ids:
+                aceptacion[ids[f] >> 3] |= 1 << (ids[f] & 7)
+        return cls(nombres, simbolos, tabla, ids[afd.estado_inicial], bytes(aceptacion))
+
+    # Al enviarlo a otro proceso, las vistas de un mmap se copian a memoria propia
+    def __getstate__(self):
+        estado = {k: getattr(self, k) for k in self.__slots__}
+        if isinstance(self.tabla, memoryview):
+            estado['tabla'] = array('i', self.tabla)
+        if isinstance(self.aceptacion, memoryview):
+            estado['aceptacion'] = bytes(self.aceptacion)
+        if not _nombres_en_memoria(self.nombres):
+            estado['nombres'] = list(self.nombres)
+        estado['_mmap'] = None
+        estado['_lote'] = None
+        return estado
+
+    def __setstate__(self, estado):
+        for k, v in estado.items():
+            setattr(self, k, v)
+
+    def a_afd(self) -> 'AFD':
+        """Reconstruye el AFD con nombres (el estado muerto no se materializa)"""
+        nombres, ancho, muerto = self.nombres, self.ancho, self.muerto
+        transiciones = {}
+        for q in range(muerto):
+            for c, simbolo in enumerate(self.simbolos):
+                d = self.tabla[q * ancho + c]
+                if d != muerto:
+                    transiciones[(nombres[q], simbolo)] = nombres[d]
+        finales = {nombres[q] for q in range(muerto) if self.es_final(q)}
+        return AFD(set(nombres), set(self.simbolos), transiciones,
+                   nombres[self.inicial], finales)
+
+    def es_final(self, estado: int) -> bool:
+        return bool((self.aceptacion[estado >> 3] >> (estado & 7)) & 1)
+
+    def _bloques_equivalentes(self) -> Tuple[List[Set[int]], Dict[int, int]]:
+        """
+        Partición de Hopcroft de los estados alcanzables (incluido el muerto si
+        se llega a él) en clases equivalentes, y el bloque de cada estado.
+        """
+        n_simbolos = len(self.simbolos)
+        tabla, ancho = self.tabla, self.ancho
+
+        # 1. Estados alcanzables (el muerto solo si se llega a él)
+        alcanzables = [self.inicial]
+        visto = {self.inicial}
+        i = 0
+        while i < len(alcanzables):
+            q = alcanzables[i]
+            for s in range(n_simbolos):
+                d = tabla[q * ancho + s]
+                if d not in visto:
+                    visto.add(d)
+                    alcanzables.append(d)
+            i += 1
+
+        # Transiciones inversas restringidas a los alcanzables
+        inversas = [{} for _ in range(n_simbolos)]
+        for q in alcanzables:
+            for s in range(n_simbolos):
+                inversas[s].setdefault(tabla[q * ancho + s], []).append(q)
+
+        # 2. Refinamiento de particiones con lista de trabajo de divisores
+        finales = [q for q in alcanzables if self.es_final(q)]
+        no_finales = [q for q in alcanzables if not self.es_final(q)]
+        bloques = [set(b) for b in (finales, no_finales) if b]
+        bloque_de = {}
+        for b, miembros in enumerate(bloques):
+            for q in miembros:
+                bloque_de[q] = b
+        if len(bloques) == 2:
+            pendientes = {0 if len(bloques[0]) <= len(bloques[1]) else 1}
+        else:
+            pendientes = set()
+
+        while pendientes:
+            divisor = list(bloques[pendientes.pop()])
+            for s in range(n_simbolos):
+                inversa = inversas[s]
+                # Predecesores por s del divisor, agrupados por bloque
+                tocados = {}
+                for q in divisor:
+                    for p in inversa.get(q, ()):
+                        tocados.setdefault(bloque_de[p], set()).add(p)
+                for b, dentro in tocados.items():
+                    if len(dentro) == len(bloques[b]):
+                        continue
+                    bloques[b] -= dentro
+                    nuevo = len(bloques)
+                    bloques.append(dentro)
+                    for p in dentro:
+                        bloque_de[p] = nuevo
+                    if b in pendientes:
+                        pendientes.add(nuevo)
+                    else:
+                        pendientes.add(nuevo if len(dentro) <= len(bloques[b]) else b)
+
+        return bloques, bloque_de
+
+    def minimizar(self) -> Tuple['AFDCompilado', int]:
+        """
+        Versión compacta de AFD.minimizar: no construye nombres. Cada bloque se
+        representa con su estado de menor índice y el bloque del estado muerto
+        pasa a ser el nuevo muerto.
+        """
+        bloques, bloque_de = self._bloques_equivalentes()
+        bloque_muerto = bloque_de.get(self.muerto)
+        if bloque_muerto == bloque_de[self.inicial]:
+            # Lenguaje vacío: se conserva el inicial como único estado
+            bloque_muerto = None
+        vivos = sorted((min(m), b) for b, m in enumerate(bloques)
+                       if b != bloque_muerto)
+        nuevo = {b: i for i, (_, b) in enumerate(vivos)}
+        n_simbolos, ancho, muerto = len(self.simbolos), self.ancho, len(vivos)
+
+        tabla = array('i', [muerto]) * ((muerto + 1) * ancho)
+        aceptacion = bytearray((muerto + 1 + 7) // 8)
+        for i, (q, _) in enumerate(vivos):
+            for s in range(n_simbolos):
+                tabla[i * ancho + s] = nuevo.get(bloque_de[self.tabla[q * ancho + s]], muerto)
+            if self.es_final(q):
+                aceptacion[i >> 3] |= 1 << (i & 7)
+        nombres = NombresSeleccionados(self.nombres, [q for q, _ in vivos])
+        minimo = AFDCompilado(nombres, list(self.simbolos), tabla,
+                              nuevo[bloque_de[self.inicial]], bytes(aceptacion))
+        return minimo, self.muerto - muerto
+
+    def evaluar_cadena(self, cadena: str) -> bool:
+        tabla, columna, ancho, muerto = self.tabla, self.columna, self.ancho, self.muerto
+        estado = self.inicial
+        for simbolo in cadena:
+            c = columna.get(simbolo)
+            if c is None:
+                return False
+            estado = tabla[estado * ancho + c]
+            if estado == muerto:
+                return False
+        return self.es_final(estado)
+
+    # Tablas NumPy para evaluar_lote (se construyen una sola vez)
+    def _tablas_lote(self):
+        if self._lote is None:
+            n_simbolos = len(self.simbolos)
+            filas = self.muerto + 1
+            base = np.frombuffer(self.tabla, dtype=np.int32).reshape(filas, self.ancho)
+            # Columnas extra: símbolo inválido → muerto, relleno → mismo estado
+            tabla = np.empty((filas, n_simbolos + 2), dtype=np.int32)
+            tabla[:, :n_simbolos] = base[:, :n_simbolos]
+            tabla[:, n_simbolos] = self.muerto
+            tabla[:, n_simbolos + 1] = np.arange(filas, dtype=np.int32)
+            aceptacion = np.unpackbits(np.frombuffer(self.aceptacion, dtype=np.uint8),
+                                       bitorder='little')[:filas].astype(bool)
+            # Solo los símbolos de un carácter pueden aparecer en una cadena
+            unitarios = sorted((ord(s), c) for s, c in self.columna.items() if len(s) == 1)
+            puntos = np.array([p for p, _ in unitarios], dtype=np.uint32)
+            columnas = np.array([c for _, c in unitarios], dtype=np.int32)
+            self._lote = (tabla, aceptacion, puntos, columnas)
+        return self._lote
+
+    # Con menos filas activas que esto, el resto de cada cadena se recorre en Python
+    MIN_ACTIVAS_LOTE = 16
+
+    def _codificar_lote(self, cadenas: List[str]) -> np.ndarray:
+        """Columnas de todos los caracteres, concatenadas (sin relleno por fila)"""
+        tabla, _, puntos, columnas = self._tablas_lote()
+        invalido = tabla.shape[1] - 2
+        # surrogatepass: un carácter suelto inválido en UTF-8 es solo un símbolo desconocido
+        codigo = np.frombuffer(''.join(cadenas).encode('utf-32-le', 'surrogatepass'),
+                               dtype=np.uint32)
+        if not len(puntos):
+            return np.full(len(codigo), invalido, dtype=np.int32)
+        pos = np.minimum(np.searchsorted(puntos, codigo), len(puntos) - 1)
+        return np.where(puntos[pos] == codigo, columnas[pos], invalido).astype(np.int32)
+
+    def evaluar_lote(self, cadenas: List[str]) -> np.ndarray:
+        """
+        Avanza todas las cadenas a la vez, un carácter por paso, sobre los
+        códigos concatenados: la memoria es proporcional al total de caracteres,
+        no a filas × la cadena más larga. Cuando quedan pocas cadenas activas
+        (las más largas), se terminan una por una.
+        """
+        cadenas = list(cadenas)
+        tabla, aceptacion, _, _ = self._tablas_lote()
+        valores = self._codificar_lote(cadenas)
+        longitudes = np.fromiter(map(len, cadenas), dtype=np.int64, count=len(cadenas))
+        inicios = np.cumsum(longitudes) - longitudes
+
+        # Ordena por longitud descendente: en el paso j solo avanzan las filas activas
+        orden = np.argsort(-longitudes, kind='stable')
+        largos = longitudes[orden]
+        posiciones = inicios[orden]
+        negativos = -largos
+        estados = np.full(len(cadenas), self.inicial, dtype=np.int32)
+        j = 0
+        while True:
+            k = int(np.searchsorted(negativos, -j, side='left'))
+            if k < self.MIN_ACTIVAS_LOTE:
+                break
+            estados[:k] = tabla[estados[:k], valores[posiciones[:k] + j]]
+            j += 1
+
+        # Resto de las cadenas más largas, desde el estado alcanzado
+        invalido, muerto = tabla.shape[1] - 2, self.muerto
+        for r in range(k):
+            estado = int(estados[r])
+            inicio = int(posiciones[r])
+            for c in valores[inicio + j:inicio + int(largos[r])].tolist():
+                estado = muerto if c == invalido else int(tabla[estado, c])
+                if estado == muerto:
+                    break
+            estados[r] = estado
+
+        resultado = np.empty(len(cadenas), dtype=bool)
+        resultado[orden] = aceptacion[estados]
+        return resultado
+
+
+# ============================================================
+# AFND INDEXADO (estados y símbolos como enteros)
+# ============================================================
+
+class AFNDIndexado:
+    """Representación entera de un AFND: los conjuntos de estados son máscaras de bits"""
+
+    __slots__ = ('nombres', 'indice', 'simbolos', 'indice_simbolo', 'finales', 'clausuras',
+                 'inicial', 'sucesores', '_bloques', '_libres')
+
+    def __init__(self, nombres: List[str], simbolos: List[str],
+                 sucesores: List[List[int]], inicial: int, finales: int,
+                 epsilon: Optional[List[int]] = None):
+        self.nombres = nombres
+        self.indice = {n: i for i, n in enumerate(nombres)}
+        self.simbolos = simbolos
+        self.indice_simbolo = {s: i for i, s in enumerate(simbolos)}
+        self.finales = finales
+        # clausuras[q] = ε-clausura de q (incluye a q); None si no hay transiciones ε
+        self.clausuras = (AFNDIndexado._calcular_clausuras(epsilon)
+                          if epsilon and any(epsilon) else None)
+        self.inicial = self.clausura(inicial)
+        # sucesores[s][q] = ε-clausura de δ(q, s): mover ya devuelve conjuntos cerrados
+        if self.clausuras is not None:
+            sucesores = [[self.clausura(m) for m in fila] for fila in sucesores]
+        self.sucesores = sucesores
+        self.descartar_tablas()
+
+    @staticmethod
+    def _calcular_clausuras(epsilon: List[int]) -> List[int]:
+        """
+        Clausuras de todos los estados en una pasada: Tarjan condensa el grafo ε
+        en componentes fuertemente conexas, que salen en orden topológico inverso,
+        así que la clausura de cada componente es la unión de sus miembros y de
+        las clausuras (ya calculadas) de sus sucesoras.
+        """
+        n = len(epsilon)
+        vecinos = []
+        for q in range(n):
+            m, lista = epsilon[q], []
+            while m:
+                bit = m & -m
+                lista.append(bit.bit_length() - 1)
+                m ^= bit
+            vecinos.append(lista)
+
+        clausuras = [0] * n
+        orden = [-1] * n
+        bajo = [0] * n
+        en_pila = [False] * n
+        pila = []
+        contador = 0
+        for raiz in range(n):
+            if orden[raiz] != -1:
+                continue
+            trabajo = [(raiz, 0)]
+            while trabajo:
+                q, i = trabajo.pop()
+                if i == 0:
+                    orden[q] = bajo[q] = contador
+                    contador += 1
+                    pila.append(q)
+                    en_pila[q] = True
+                if i < len(vecinos[q]):
+                    trabajo.append((q, i + 1))
+                    d = vecinos[q][i]
+                    if orden[d] == -1:
+                        trabajo.append((d, 0))
+                    elif en_pila[d]:
+                        bajo[q] = min(bajo[q], orden[d])
+                    continue
+                if trabajo:
+                    padre = trabajo[-1][0]
+                    bajo[padre] = min(bajo[padre], bajo[q])
+                if bajo[q] == orden[q]:
+                    componente = []
+                    while True:
+                        x = pila.pop()
+                        en_pila[x] = False
+                        componente.append(x)
+                        if x == q:
+                            break
+                    mascara = 0
+                    for x in componente:
+                        mascara |= 1 << x
+                    for x in componente:
+                        for d in vecinos[x]:
+                            mascara |= clausuras[d]
+                    for x in componente:
+                        clausuras[x] = mascara
+        return clausuras
+
+    def clausura(self, mascara: int) -> int:
+        clausuras = self.clausuras
+        if clausuras is None:
+            return mascara
+        resultado = mascara
+        while mascara:
+            bit = mascara & -mascara
+            resultado |= clausuras[bit.bit_length() - 1]
+            mascara ^= bit
+        return resultado
+
+    @classmethod
+    def desde_arreglos(cls, nombres: List[str], simbolos: List[str], alfabeto: Set[str],
+                       inicial: int, finales, origenes, simbolos_transicion,
+                       punteros, destinos) -> 'AFNDIndexado':
+        """
+        Construye la representación directamente desde arreglos columnares:
+        la transición i va de origenes[i] con simbolos[simbolos_transicion[i]]
+        a destinos[punteros[i]:punteros[i + 1]] (formato CSR). Los símbolos que
+        no están en `alfabeto` se ignoran, salvo ε.
+        """
+        propios = sorted(set(alfabeto) - {EPSILON})
+        nuevo_indice = {s: i for i, s in enumerate(propios)}
+        # -1 = transición vacía, None = símbolo fuera del alfabeto
+        traduccion = [-1 if s == EPSILON else nuevo_indice.get(s) for s in simbolos]
+
+        n = len(nombres)
+        sucesores = [[0] * n for _ in propios]
+        epsilon = [0] * n
+        for i in range(len(origenes)):
+            s = traduccion[simbolos_transicion[i]]
+            if s is None:
+                continue
+            mascara = 0
+            for d in destinos[punteros[i]:punteros[i + 1]]:
+                mascara |= 1 << d
+            fila = epsilon if s == -1 else sucesores[s]
+            fila[origenes[i]] |= mascara
+
+        mascara_finales = 0
+        for f in finales:
+            mascara_finales |= 1 << f
+        return cls(list(nombres), propios, sucesores, 1 << inicial, mascara_finales, epsilon)
+
+    # Ya es la representación indexada (permite usarla donde se espera un AFND)
+    def indexar(self) -> 'AFNDIndexado':
+        return self
+
+    @classmethod
+    def desde_afnd(cls, afnd: 'AFND') -> 'AFNDIndexado':
+        todos = set(afnd.estados) | {afnd.estado_inicial}
+        for (origen, _), destinos in afnd.transiciones.items():
+            todos.add(origen)
+            todos.update(destinos)
+        # Orden alfabético: los bits ascendentes producen nombres ya ordenados
+        nombres = sorted(todos)
+        indice = {n: i for i, n in enumerate(nombres)}
+        simbolos = sorted(set(afnd.alfabeto) - {EPSILON})
+        indice_simbolo = {s: i for i, s in enumerate(simbolos)}
+
+        sucesores = [[0] * len(nombres) for _ in simbolos]
+        epsilon = [0] * len(nombres)
+        for (origen, simbolo), destinos in afnd.transiciones.items():
+            if simbolo == EPSILON:
+                fila, q = epsilon, indice[origen]
             else:
-                dot.node(estado)
-        
-        dot.node('', shape='none')
-        dot.edge('', self.estado_inicial)
-        
-        for (origen, simbolo), destino in self.transiciones.items():
-            dot.edge(origen, destino, label=simbolo)
-        
-        dot.render(nombre_archivo, format='png', cleanup=True)
-        print(f"\n✓ Diagrama AFD generado: {nombre_archivo}.png")
-        return dot
+                s = indice_simbolo.get(simbolo)
+                if s is None:
+                    continue
+                fila, q = sucesores[s], indice[origen]
+            mascara = 0
+            for d in destinos:
+                mascara |= 1 << indice[d]
+            fila[q] |= mascara
+
+        finales = 0
+        for f in afnd.estados_finales:
+            if f in indice:
+                finales |= 1 << indice[f]
+        return cls(nombres, simbolos, sucesores, 1 << indice[afnd.estado_inicial], finales,
+                   epsilon)
+
+    def descartar_tablas(self):
+        """Olvida las tablas por bloques; llamar tras editar `sucesores` en el lugar"""
+        # _bloques[s][b][v] = sucesores por s del byte v del bloque b (se llena al usarse)
+        self._bloques: List[List[Optional[List[Optional[int]]]]] = [
+            [None] * ((len(self.nombres) + 7) // 8) for _ in self.simbolos]
+        # Entradas que aún se pueden guardar: cada una es una máscara de n bits
+        self._libres = MAX_BITS_TABLAS // max(len(self.nombres), 1)
+
+    # Une los sucesores de cada bit encendido
+    def mover(self, mascara: int, simbolo: int) -> int:
+        tabla = self.sucesores[simbolo]
+        resultado = 0
+        while mascara:
+            bit = mascara & -mascara
+            resultado |= tabla[bit.bit_length() - 1]
+            mascara ^= bit
+        return resultado
+
+    def mover_por_bloques(self, mascara: int, simbolo: int) -> int:
+        """
+        Igual que `mover`, pero recorre la máscara de a 8 estados y obtiene los
+        sucesores de cada byte con una sola consulta a tabla: cada símbolo cuesta
+        un OR por byte no nulo en lugar de uno por estado. Solo se recorren los
+        bytes entre el bit encendido más bajo y el más alto, así que una máscara
+        rala de un autómata grande no cuesta n/8 pasos; un solo estado va directo
+        a `sucesores`. Agotado MAX_BITS_TABLAS, los bytes sin tabla se resuelven
+        con `mover` sin guardarse.
+        """
+        if not mascara & (mascara - 1):
+            # Cero o un solo estado: basta la fila de sucesores
+            return self.sucesores[simbolo][mascara.bit_length() - 1] if mascara else 0
+        bloques = self._bloques[simbolo]
+        resultado = 0
+        primero = ((mascara & -mascara).bit_length() - 1) >> 3
+        mascara >>= 8 * primero
+        for b, valor in enumerate(mascara.to_bytes((mascara.bit_length() + 7) >> 3, 'little'),
+                                  primero):
+            if not valor:
+                continue
+            tabla = bloques[b]
+            if tabla is None:
+                if self._libres < 256:
+                    resultado |= self.mover(valor << (8 * b), simbolo)
+                    continue
+                self._libres -= 256
+                tabla = bloques[b] = [None] * 256
+            destino = tabla[valor]
+            if destino is None:
+                destino = tabla[valor] = self.mover(valor << (8 * b), simbolo)
+            resultado |= destino
+        return resultado
+
+    def evaluar_cadena(self, cadena: str) -> bool:
+        actual = self.inicial
+        indice_simbolo = self.indice_simbolo
+        for simbolo in cadena:
+            s = indice_simbolo.get(simbolo)
+            if s is None:
+                return False
+            actual = self.mover_por_bloques(actual, s)
+            if not actual:
+                return False
+        return bool(actual & self.finales)
+
+    def estados_de(self, mascara: int) -> Set[str]:
+        estados = set()
+        while mascara:
+            bit = mascara & -mascara
+            estados.add(self.nombres[bit.bit_length() - 1])
+            mascara ^= bit
+        return estados
+
+    def nombre(self, mascara: int) -> str:
+        """Mismo formato que ConversorAFNDaAFD._nombre_estado"""
+        if not mascara:
+            return "∅"
+        return "{" + ",".join(sorted(self.estados_de(mascara))) + "}"
+
+
+class AFNDCompacto:
+    """
+    AFND guardado en arreglos int32, en el mismo formato CSR que el archivo
+    columnar: los destinos de (q, s) son destinos[punteros[s*n + q]:punteros[s*n + q + 1]],
+    con s = len(simbolos) para ε. Ocupa unos pocos bytes por transición, frente
+    a un set por transición del AFND o una máscara de n bits por (estado,
+    símbolo) de AFNDIndexado. Las máscaras solo se arman al pedir `indexar()`.
+    """
+
+    __slots__ = ('nombres', 'simbolos', 'indice_simbolo', 'inicial', 'finales',
+                 'punteros', 'destinos')
+
+    def __init__(self, nombres: List[str], simbolos: List[str], inicial: int,
+                 finales: bytes, punteros: array, destinos: array):
+        self.nombres = nombres
+        self.simbolos = simbolos
+        self.indice_simbolo = {s: i for i, s in enumerate(simbolos)}
+        self.inicial = inicial
+        # Mapa de bits de estados finales
+        self.finales = finales
+        self.punteros = punteros
+        self.destinos = destinos
+
+    @classmethod
+    def desde_arreglos(cls, nombres: List[str], simbolos: List[str], alfabeto: Set[str],
+                       inicial: int, finales, origenes, simbolos_transicion,
+                       punteros, destinos) -> 'AFNDCompacto':
+        """Mismos arreglos que AFNDIndexado.desde_arreglos, reordenados por (símbolo, estado)"""
+        propios = sorted(set(alfabeto) - {EPSILON})
+        nuevo_indice = {s: i for i, s in enumerate(propios)}
+        k, n = len(propios), len(nombres)
+        # k = transición vacía, None = símbolo fuera del alfabeto
+        traduccion = [k if s == EPSILON else nuevo_indice.get(s) for s in simbolos]
+
+        # Ordenamiento por conteo: cantidad de destinos de cada fila (s, q)
+        filas = array('i', [0]) * (len(origenes))
+        conteos = array('i', [0]) * ((k + 1) * n + 1)
+        for i in range(len(origenes)):
+            s = traduccion[simbolos_transicion[i]]
+            fila = -1 if s is None else s * n + origenes[i]
+            filas[i] = fila
+            if fila >= 0:
+                conteos[fila + 1] += punteros[i + 1] - punteros[i]
+        for j in range(1, len(conteos)):
+            conteos[j] += conteos[j - 1]
+
+        ordenados = array('i', [0]) * conteos[-1]
+        posicion = conteos[:-1]
+        for i in range(len(origenes)):
+            fila = filas[i]
+            if fila < 0:
+                continue
+            inicio, cantidad = posicion[fila], punteros[i + 1] - punteros[i]
+            ordenados[inicio:inicio + cantidad] = array('i', destinos[punteros[i]:punteros[i + 1]])
+            posicion[fila] = inicio + cantidad
+
+        mapa_finales = bytearray((n + 7) // 8)
+        for f in finales:
+            mapa_finales[f >> 3] |= 1 << (f & 7)
+        return cls(list(nombres), propios, inicial, bytes(mapa_finales), conteos, ordenados)
+
+    @classmethod
+    def desde_afnd(cls, afnd: 'AFND') -> 'AFNDCompacto':
+        todos = set(afnd.estados) | {afnd.estado_inicial}
+        for (origen, _), destinos in afnd.transiciones.items():
+            todos.add(origen)
+            todos.update(destinos)
+        nombres = sorted(todos)
+        indice = {n: i for i, n in enumerate(nombres)}
+        simbolos = sorted(set(afnd.alfabeto) | {EPSILON})
+        indice_simbolo = {s: i for i, s in enumerate(simbolos)}
+
+        origenes, simbolos_transicion = array('i'), array('i')
+        punteros, destinos = array('q', [0]), array('i')
+        for (origen, simbolo), ds in afnd.transiciones.items():
+            s = indice_simbolo.get(simbolo)
+            if s is None:
+                continue
+            origenes.append(indice[origen])
+            simbolos_transicion.append(s)
+            destinos.extend(indice[d] for d in ds)
+            punteros.append(len(destinos))
+        finales = [indice[f] for f in afnd.estados_finales if f in indice]
+        return cls.desde_arreglos(nombres, simbolos, set(afnd.alfabeto), indice[afnd.estado_inicial],
+                                  finales, origenes, simbolos_transicion, punteros, destinos)
+
+    def es_final(self, estado: int) -> bool:
+        return bool((self.finales[estado >> 3] >> (estado & 7)) & 1)
+
+    def destinos_de(self, estado: int, simbolo: int) -> array:
+        fila = simbolo * len(self.nombres) + estado
+        return self.destinos[self.punteros[fila]:self.punteros[fila + 1]]
+
+    def indexar(self) -> AFNDIndexado:
+        """Representación con máscaras para convertir; se arma en cada llamada"""
+        n = len(self.nombres)
+        punteros, destinos = self.punteros, self.destinos
+
+        def _mascaras(s: int) -> List[int]:
+            fila = []
+            for q in range(s * n, (s + 1) * n):
+                mascara = 0
+                for d in destinos[punteros[q]:punteros[q + 1]]:
+                    mascara |= 1 << d
+                fila.append(mascara)
+            return fila
+
+        sucesores = [_mascaras(s) for s in range(len(self.simbolos))]
+        finales = int.from_bytes(self.finales, 'little')
+        return AFNDIndexado(list(self.nombres), list(self.simbolos), sucesores,
+                            1 << self.inicial, finales, _mascaras(len(self.simbolos)))
+
+    def _clausura(self, estados: Set[int]) -> Set[int]:
+        base = len(self.simbolos) * len(self.nombres)
+        punteros, destinos = self.punteros, self.destinos
+        if punteros[base] == punteros[-1]:
+            return estados
+        pila = list(estados)
+        while pila:
+            fila = base + pila.pop()
+            for d in destinos[punteros[fila]:punteros[fila + 1]]:
+                if d not in estados:
+                    estados.add(d)
+                    pila.append(d)
+        return estados
+
+    def evaluar_cadena(self, cadena: str) -> bool:
+        """Simulación con conjuntos de enteros: el costo depende de los estados activos, no de n"""
+        n = len(self.nombres)
+        punteros, destinos = self.punteros, self.destinos
+        actual = self._clausura({self.inicial})
+        for simbolo in cadena:
+            s = self.indice_simbolo.get(simbolo)
+            if s is None:
+                return False
+            base = s * n
+            siguiente = set()
+            for q in actual:
+                siguiente.update(destinos[punteros[base + q]:punteros[base + q + 1]])
+            if not siguiente:
+                return False
+            actual = self._clausura(siguiente)
+        return any(self.es_final(q) for q in actual)
+
+    def a_afnd(self) -> 'AFND':
+        n, nombres = len(self.nombres), self.nombres
+        transiciones = {}
+        for s, simbolo in enumerate(self.simbolos + [EPSILON]):
+            for q in range(n):
+                ds = self.destinos_de(q, s)
+                if len(ds):
+                    transiciones[(nombres[q], simbolo)] = {nombres[d] for d in ds}
+        finales = {nombres[q] for q in range(n) if self.es_final(q)}
+        return AFND(set(nombres), set(self.simbolos), transiciones, nombres[self.inicial], finales)
 
 
 # ============================================================
 # CONVERSOR AFND → AFD
 # ============================================================
 
+class EstadisticasConversion:
+    """Métricas de una conversión: tiempos por fase, tamaño y trabajo realizado"""
+
+    def __init__(self):
+        self.tiempos: Dict[str, float] = {}
+        self.estados_descubiertos = 0
+        self.estados_procesados = 0
+        self.profundidad_cola = 0
+        self.pico_cola = 0
+        self.transiciones = 0
+        self.llamadas_mover = 0
+        self.estados_eliminados = 0
+        # False si la conversión se detuvo antes de terminar (ver motivo_parada)
+        self.completa = True
+        self.motivo_parada: Optional[str] = None
+        self.reanudada = False
+        self._inicio = time.perf_counter()
+
+    @property
+    def segundos(self) -> float:
+        return time.perf_counter() - self._inicio
+
+    @property
+    def transiciones_por_segundo(self) -> float:
+        t = self.tiempos.get('construccion') or self.segundos
+        return self.transiciones / t if t > 0 else 0.0
+
+    def __str__(self) -> str:
+        fases = ", ".join(f"{f}: {t:.3f} s" for f, t in self.tiempos.items())
+        texto = (f"{self.estados_descubiertos} estados, {self.transiciones} transiciones, "
+                 f"{self.llamadas_mover} llamadas a mover, pico de cola {self.pico_cola} "
+                 f"({fases})")
+        if not self.completa:
+            texto += f" [PARCIAL: {self.motivo_parada}]"
+        return texto
+
+
+class LimitesConversion:
+    """
+    Límites de recursos para la construcción por subconjuntos:
+      - max_estados: máximo de estados AFD descubiertos
+      - memoria_max: memoria residente máxima del proceso, en bytes
+      - tiempo_max: segundos de construcción
+      - cancelacion: objeto con is_set() (p. ej. threading.Event) para cancelar
+      - ruta_checkpoint: archivo donde guardar la frontera cada
+        `intervalo_checkpoint` segundos; si existe al empezar, se reanuda
+        (recortado a max_estados si lo supera, sin sobrescribir el archivo)
+    """
+
+    # Cada cuántos estados procesados se revisan los límites caros
+    CADA = 256
+
+    def __init__(self, max_estados: Optional[int] = None, memoria_max: Optional[int] = None,
+                 tiempo_max: Optional[float] = None, cancelacion=None,
+                 ruta_checkpoint: Optional[str] = None, intervalo_checkpoint: float = 30.0):
+        self.max_estados = max_estados
+        self.memoria_max = memoria_max
+        self.tiempo_max = tiempo_max
+        self.cancelacion = cancelacion
+        self.ruta_checkpoint = ruta_checkpoint
+        self.intervalo_checkpoint = intervalo_checkpoint
+
+    def motivo_parada(self, descubiertos: int, inicio: float) -> Optional[str]:
+        if self.max_estados is not None and descubiertos > self.max_estados:
+            return f"se superó el máximo de {self.max_estados} estados"
+        if self.cancelacion is not None and self.cancelacion.is_set():
+            return "cancelada"
+        if self.tiempo_max is not None and time.perf_counter() - inicio > self.tiempo_max:
+            return f"se superó el tiempo máximo de {self.tiempo_max} s"
+        if self.memoria_max is not None and _memoria_residente() > self.memoria_max:
+            return f"se superó la memoria máxima de {self.memoria_max} bytes"
+        return None
+
+
+def _memoria_residente() -> int:
+    """Memoria residente actual del proceso en bytes (0 si no se puede medir)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # Sin psutil ni /proc (p. ej. macOS) solo se conoce el pico, que acota por arriba
+    # a la actual; ru_maxrss viene en bytes en macOS y en KB en el resto
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
 class ConversorAFNDaAFD:
     @staticmethod
-    def convertir(afnd: AFND) -> AFD:
-        print("\n" + "="*60)
-        print("INICIANDO CONVERSIÓN DE AFND A AFD")
-        print("="*60)
-        
-        alfabeto_afd = afnd.alfabeto
-        estados_afd = set()
-        transiciones_afd = {}
-        estados_finales_afd = set()
-        
-        conjunto_inicial = frozenset({afnd.estado_inicial})
-        estado_inicial_afd = ConversorAFNDaAFD._nombre_estado(conjunto_inicial)
-        
-        cola = deque([conjunto_inicial])
-        estados_procesados = {conjunto_inicial}
-        estados_afd.add(estado_inicial_afd)
-        
-        print(f"\nEstado inicial AFD: {estado_inicial_afd}")
+    def convertir(afnd: Union[AFND, 'AFNDIndexado'], minimizar: bool = False,
+                  progreso: Optional[Callable[[EstadisticasConversion], None]] = None,
+                  limites: Optional[LimitesConversion] = None) -> AFD:
+        return ConversorAFNDaAFD.convertir_con_estadisticas(afnd, minimizar, progreso,
+                                                           limites=limites)[0]
+
+    @staticmethod
+    def convertir_con_estadisticas(afnd: Union[AFND, 'AFNDIndexado'], minimizar: bool = False,
+                                   progreso: Optional[Callable[[EstadisticasConversion], None]] = None,
+                                   intervalo_progreso: int = 1000,
+                                   limites: Optional[LimitesConversion] = None
+                                   ) -> Tuple[AFD, EstadisticasConversion]:
+        """
+        Construcción por subconjuntos silenciosa. Si se pasa `progreso`, se llama
+        con las estadísticas en curso cada `intervalo_progreso` estados procesados
+        y una vez al terminar la construcción.
+
+        Con `limites`, la construcción se detiene limpiamente al alcanzar alguno:
+        devuelve un AFD parcial (los estados sin procesar quedan sin
+        transiciones) y `stats.completa` en False. No se minimiza un AFD parcial.
+        """
+        stats = EstadisticasConversion()
+        t = time.perf_counter()
+        indexado = afnd.indexar()
+        stats.tiempos['indexado'] = time.perf_counter() - t
+
+        mascaras, filas = ConversorAFNDaAFD._explorar(indexado, stats, progreso,
+                                                      intervalo_progreso, limites)
         
-        if conjunto_inicial & afnd.estados_finales:
-            estados_finales_afd.add(estado_inicial_afd)
-            print(f"  → Es estado final")
+        t = time.perf_counter()
+        afd = ConversorAFNDaAFD.construir_afd(indexado, mascaras, filas)
+        stats.tiempos['nombrado'] = time.perf_counter() - t
         
-        print("\nProcesando transiciones:")
-        print("-" * 40)
+        if minimizar and stats.completa:
+            t = time.perf_counter()
+            afd, stats.estados_eliminados = afd.minimizar()
+            stats.tiempos['minimizacion'] = time.perf_counter() - t
+        return afd, stats
+
+    @staticmethod
+    def convertir_compacto(afnd: Union[AFND, 'AFNDIndexado'], minimizar: bool = False,
+                           progreso: Optional[Callable[[EstadisticasConversion], None]] = None,
+                           limites: Optional[LimitesConversion] = None) -> 'AFDCompilado':
+        """
+        Igual que `convertir`, pero devuelve directamente la forma compilada:
+        tabla entera en un array y nombres generados solo al pedirlos, sin el
+        diccionario de transiciones ni los textos "{q0,q1,...}" de cada estado.
+        Si hace falta el AFD con nombres, se obtiene con `a_afd()`.
+        """
+        stats = EstadisticasConversion()
+        indexado = afnd.indexar()
+        mascaras, filas = ConversorAFNDaAFD._explorar(indexado, stats, progreso, 1000, limites)
+        compilado = ConversorAFNDaAFD.construir_compilado(indexado, mascaras, filas)
+        if minimizar and stats.completa:
+            compilado, _ = compilado.minimizar()
+        return compilado
+
+    @staticmethod
+    def _explorar(indexado: 'AFNDIndexado', stats: EstadisticasConversion,
+                  progreso: Optional[Callable[[EstadisticasConversion], None]],
+                  intervalo_progreso: int, limites: Optional[LimitesConversion]
+                  ) -> Tuple[List[int], List[List[int]]]:
+        """Recorrido BFS de los subconjuntos: máscaras descubiertas y filas de destinos"""
+        limites = limites or LimitesConversion()
+        n_simbolos = len(indexado.simbolos)
+        max_estados = limites.max_estados
+        # Cada subconjunto es una máscara de bits; se numera en orden de descubrimiento
+        t = time.perf_counter()
+        mascaras = [indexado.inicial]
+        filas = []
+        ruta_checkpoint = limites.ruta_checkpoint
+        if ruta_checkpoint:
+            previo = ConversorAFNDaAFD._cargar_checkpoint(ruta_checkpoint, indexado)
+            if previo:
+                mascaras, filas = previo
+                stats.reanudada = True
+                if max_estados is not None and len(mascaras) > max_estados:
+                    # El checkpoint supera el máximo actual: se conservan los primeros
+                    # estados y las filas que solo apuntan a ellos; el archivo no se
+                    # sobrescribe para no perder el avance guardado
+                    mascaras = mascaras[:max_estados]
+                    procesadas = 0
+                    while (procesadas < len(filas) and procesadas < max_estados
+                           and max(filas[procesadas], default=0) < max_estados):
+                        procesadas += 1
+                    filas = filas[:procesadas]
+                    ruta_checkpoint = None
+        ids = {m: j for j, m in enumerate(mascaras)}
+        ultimo_checkpoint = time.perf_counter()
         
-        while cola:
-            conjunto_actual = cola.popleft()
-            nombre_actual = ConversorAFNDaAFD._nombre_estado(conjunto_actual)
+        i = len(filas)
+        while i < len(mascaras):
+            if i % LimitesConversion.CADA == 0:
+                motivo = limites.motivo_parada(len(mascaras), t)
+                if motivo:
+                    stats.motivo_parada = motivo
+                    break
+                if ruta_checkpoint and (time.perf_counter() - ultimo_checkpoint
+                                        >= limites.intervalo_checkpoint):
+                    ConversorAFNDaAFD._guardar_checkpoint(ruta_checkpoint, indexado,
+                                                          mascaras, filas)
+                    ultimo_checkpoint = time.perf_counter()
+            mascara = mascaras[i]
+            fila = []
+            nuevos = 0
+            for s in range(n_simbolos):
+                destino = indexado.mover(mascara, s)
+                id_destino = ids.get(destino)
+                if id_destino is None:
+                    if max_estados is not None and len(mascaras) >= max_estados:
+                        break
+                    id_destino = len(mascaras)
+                    ids[destino] = id_destino
+                    mascaras.append(destino)
+                    nuevos += 1
+                fila.append(id_destino)
+            if len(fila) < n_simbolos:
+                # La fila necesita más estados que el máximo: se deshace y queda sin procesar
+                for m in mascaras[len(mascaras) - nuevos:]:
+                    del ids[m]
+                del mascaras[len(mascaras) - nuevos:]
+                stats.motivo_parada = f"se alcanzó el máximo de {max_estados} estados"
+                break
+            filas.append(fila)
+            i += 1
             
-            for simbolo in alfabeto_afd:
-                conjunto_mover = afnd.mover(conjunto_actual, simbolo)
-                conjunto_destino = frozenset(conjunto_mover)
-                nombre_destino = ConversorAFNDaAFD._nombre_estado(conjunto_destino)
-                
-                print(f"  δ({nombre_actual}, {simbolo}) = {nombre_destino}")
-                transiciones_afd[(nombre_actual, simbolo)] = nombre_destino
-                
-                if conjunto_destino not in estados_procesados:
-                    estados_procesados.add(conjunto_destino)
-                    estados_afd.add(nombre_destino)
-                    cola.append(conjunto_destino)
-                    
-                    if conjunto_destino & afnd.estados_finales:
-                        estados_finales_afd.add(nombre_destino)
-                        print(f"    → {nombre_destino} es estado final")
-
-        print("\n" + "="*60)
-        print("CONVERSIÓN COMPLETADA")
-        print("="*60)
+            pendientes = len(mascaras) - i
+            if pendientes > stats.pico_cola:
+                stats.pico_cola = pendientes
+            if progreso and i % intervalo_progreso == 0:
+                ConversorAFNDaAFD._actualizar(stats, i, len(mascaras), n_simbolos, t)
+                progreso(stats)
         
-        return AFD(estados_afd, alfabeto_afd, transiciones_afd,
-                   estado_inicial_afd, estados_finales_afd)
+        ConversorAFNDaAFD._actualizar(stats, i, len(mascaras), n_simbolos, t)
+        stats.tiempos['construccion'] = time.perf_counter() - t
+        stats.completa = i == len(mascaras)
+        if ruta_checkpoint:
+            if stats.completa:
+                if os.path.exists(ruta_checkpoint):
+                    os.remove(ruta_checkpoint)
+            else:
+                ConversorAFNDaAFD._guardar_checkpoint(ruta_checkpoint, indexado, mascaras, filas)
+        if progreso:
+            progreso(stats)
+        return mascaras, filas
+
+    @staticmethod
+    def construir_afd(indexado: 'AFNDIndexado', mascaras: List[int],
+                      filas: List[List[int]]) -> AFD:
+        """
+        Arma el AFD a partir de los subconjuntos descubiertos (mascaras[0] es el
+        inicial) y de las filas de destinos por símbolo. Los nombres legibles
+        solo se construyen aquí, una vez por estado.
+        """
+        nombres = [indexado.nombre(m) for m in mascaras]
+        finales = indexado.finales
+        estados_finales = {nombres[j] for j, m in enumerate(mascaras) if m & finales}
+        transiciones = {}
+        for j, fila in enumerate(filas):
+            nombre_actual = nombres[j]
+            for s, id_destino in enumerate(fila):
+                transiciones[(nombre_actual, indexado.simbolos[s])] = nombres[id_destino]
+        return AFD(set(nombres), set(indexado.simbolos), transiciones,
+                   nombres[0], estados_finales)
+
+    @staticmethod
+    def construir_compilado(indexado: 'AFNDIndexado', mascaras: List[int],
+                            filas: List[List[int]]) -> 'AFDCompilado':
+        """Como construir_afd, pero a la tabla compilada; las filas sin procesar van al muerto"""
+        n = len(mascaras)
+        ancho = max(len(indexado.simbolos), 1)
+        tabla = array('i', [n]) * ((n + 1) * ancho)
+        for j, fila in enumerate(filas):
+            if fila:
+                tabla[j * ancho:j * ancho + len(fila)] = array('i', fila)
+        aceptacion = bytearray((n + 1 + 7) // 8)
+        finales = indexado.finales
+        for j, m in enumerate(mascaras):
+            if m & finales:
+                aceptacion[j >> 3] |= 1 << (j & 7)
+        return AFDCompilado(NombresSubconjuntos(indexado, mascaras), list(indexado.simbolos),
+                            tabla, 0, bytes(aceptacion))
+
+    @staticmethod
+    def _huella(indexado: 'AFNDIndexado') -> str:
+        """Identifica el AFND para no reanudar un checkpoint de otro autómata"""
+        datos = pickle.dumps((indexado.nombres, indexado.simbolos, indexado.sucesores,
+                              indexado.inicial, indexado.finales))
+        return hashlib.sha256(datos).hexdigest()
+
+    @staticmethod
+    def _guardar_checkpoint(ruta: str, indexado: 'AFNDIndexado',
+                            mascaras: List[int], filas: List[List[int]]):
+        # Se escribe a un temporal y se renombra: un corte no deja el archivo a medias
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "wb") as f:
+            pickle.dump({"huella": ConversorAFNDaAFD._huella(indexado),
+                         "mascaras": mascaras, "filas": filas}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta)
+
+    @staticmethod
+    def _cargar_checkpoint(ruta: str, indexado: 'AFNDIndexado'
+                           ) -> Optional[Tuple[List[int], List[List[int]]]]:
+        if not os.path.exists(ruta):
+            return None
+        with open(ruta, "rb") as f:
+            datos = pickle.load(f)
+        if datos.get("huella") != ConversorAFNDaAFD._huella(indexado):
+            return None
+        return datos["mascaras"], datos["filas"]
+
+    @staticmethod
+    def _actualizar(stats: EstadisticasConversion, procesados: int, descubiertos: int,
+                    n_simbolos: int, inicio: float):
+        stats.estados_procesados = procesados
+        stats.estados_descubiertos = descubiertos
+        stats.profundidad_cola = descubiertos - procesados
+        stats.transiciones = stats.llamadas_mover = procesados * n_simbolos
+        stats.tiempos['construccion'] = time.perf_counter() - inicio
     
     @staticmethod
     def _nombre_estado(conjunto: frozenset) -> str:
@@ -218,14 +1286,15 @@ def crear_afnd_desde_dict(config: dict) -> AFND:
     transiciones = {}
     for t in config['transiciones']:
         origen = t['origen']
-        simbolo = t['simbolo']
+        # La transición vacía puede escribirse como "ε" o como ""
+        simbolo = t['simbolo'] or EPSILON
         destinos = set(t['destinos'])
-        transiciones[(origen, simbolo)] = destinos
+        transiciones.setdefault((origen, simbolo), set()).update(destinos)
     
     return AFND(estados, alfabeto, transiciones, estado_inicial, estados_finales)
 
 
-def guardar_afnd_en_json(afnd: AFND, nombre_archivo: str):
+def guardar_afnd_en_json(afnd: AFND, nombre_archivo: str, legible: bool = False):
     data = {
         "estados": list(afnd.estados),
         "alfabeto": list(afnd.alfabeto),
@@ -238,7 +1307,11 @@ def guardar_afnd_en_json(afnd: AFND, nombre_archivo: str):
     }
     ruta = f"{nombre_archivo}.json"
     with open(ruta, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+        # Por defecto sin sangría ni espacios: los AFND grandes ocupan mucho menos
+        if legible:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        else:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
     print(f"\n✅ AFND guardado exitosamente en '{ruta}'")
 
 
@@ -250,3 +1323,129 @@ def cargar_afnd_desde_json(nombre_archivo: str) -> AFND:
         data = json.load(f)
     print(f"\n📂 AFND cargado desde '{ruta}' correctamente")
     return crear_afnd_desde_dict(data)
+
+
+# ============================================================
+# CARGA INCREMENTAL DE AFND GRANDES
+# ============================================================
+
+class _LectorJSONIncremental:
+    """Lee valores JSON de un archivo por bloques, sin cargarlo completo"""
+
+    def __init__(self, archivo, tam_bloque: int):
+        self.archivo = archivo
+        self.tam_bloque = tam_bloque
+        self.buffer = ''
+        self.pos = 0
+        self.agotado = False
+        self.decodificador = json.JSONDecoder()
+
+    def _rellenar(self, tam: int) -> bool:
+        bloque = self.archivo.read(tam)
+        if not bloque:
+            self.agotado = True
+            return False
+        self.buffer = self.buffer[self.pos:] + bloque
+        self.pos = 0
+        return True
+
+    def siguiente(self) -> str:
+        """Primer carácter no blanco (sin consumirlo); '' al final del archivo"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._rellenar(self.tam_bloque):
+                return ''
+
+    def consumir(self, esperados: str) -> str:
+        c = self.siguiente()
+        if not c or c not in esperados:
+            raise ValueError(f"JSON inválido: se esperaba uno de {esperados!r} y se encontró {c!r}")
+        self.pos += 1
+        return c
+
+    def valor(self):
+        self.siguiente()
+        tam = self.tam_bloque
+        while True:
+            try:
+                valor, fin = self.decodificador.raw_decode(self.buffer, self.pos)
+                # Un número al borde del buffer podría estar cortado
+                if fin < len(self.buffer) or self.agotado:
+                    self.pos = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self.agotado:
+                    raise
+            # Valor incompleto: leer más (cada vez el doble para no re-escanear demasiado)
+            self._rellenar(tam)
+            tam *= 2
+
+
+def cargar_afnd_json_incremental(nombre_archivo: str, tam_bloque: int = 1 << 20,
+                                 compacto: bool = False
+                                 ) -> Union[AFNDIndexado, AFNDCompacto]:
+    """
+    Carga un AFND con el esquema JSON habitual leyendo el archivo por bloques y
+    construyendo directamente la representación indexada: las transiciones se
+    acumulan en arreglos enteros (CSR) sin crear un set por entrada. Con
+    `compacto` se devuelve un AFNDCompacto que conserva esos arreglos.
+    """
+    ruta = f"{nombre_archivo}.json"
+    if not os.path.exists(ruta):
+        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
+
+    indice_estado: Dict[str, int] = {}
+    indice_simbolo: Dict[str, int] = {}
+    origenes, simbolos_transicion = array('i'), array('i')
+    punteros, destinos = array('q', [0]), array('i')
+    datos = {}
+
+    def _estado(nombre: str) -> int:
+        i = indice_estado.get(nombre)
+        if i is None:
+            i = indice_estado[nombre] = len(indice_estado)
+        return i
+
+    with open(ruta, "r", encoding="utf-8") as f:
+        lector = _LectorJSONIncremental(f, tam_bloque)
+        lector.consumir('{')
+        if lector.siguiente() == '}':
+            raise ValueError(f"'{ruta}' no contiene un AFND")
+        while True:
+            clave = lector.valor()
+            lector.consumir(':')
+            if clave != 'transiciones':
+                datos[clave] = lector.valor()
+            else:
+                lector.consumir('[')
+                if lector.siguiente() == ']':
+                    lector.consumir(']')
+                else:
+                    while True:
+                        t = lector.valor()
+                        simbolo = t['simbolo'] or EPSILON
+                        s = indice_simbolo.get(simbolo)
+                        if s is None:
+                            s = indice_simbolo[simbolo] = len(indice_simbolo)
+                        origenes.append(_estado(t['origen']))
+                        simbolos_transicion.append(s)
+                        destinos.extend(_estado(d) for d in t['destinos'])
+                        punteros.append(len(destinos))
+                        if lector.consumir(',]') == ']':
+                            break
+            if lector.consumir(',}') == '}':
+                break
+
+    for e in datos['estados']:
+        _estado(e)
+    inicial = _estado(datos['estado_inicial'])
+    finales = [_estado(e) for e in datos['estados_finales']]
+    nombres = sorted(indice_estado, key=indice_estado.get)
+    simbolos = sorted(indice_simbolo, key=indice_simbolo.get)
+    print(f"\n📂 AFND cargado desde '{ruta}' correctamente")
+    clase = AFNDCompacto if compacto else AFNDIndexado
+    return clase.desde_arreglos(nombres, simbolos, set(datos['alfabeto']), inicial,
+                                finales, origenes, simbolos_transicion, punteros, destinos)
@@ -0,0 +1,250 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import List, Union
+
+from logica_automata import AFD, AFDCompilado, AFND, AFNDCompacto, AFNDIndexado
+
+
+# ============================================================
+# FORMATO BINARIO DE AFD COMPILADOS (.afdb)
+# ============================================================
+#
+# Todo en little-endian, cada sección alineada a 4 bytes:
+#
+#   cabecera   magia "AFDB", versión, n estados, k símbolos, ancho, inicial,
+#              y el desplazamiento de cada sección
+#   símbolos   k+1 desplazamientos uint32 + texto UTF-8
+#   tabla      (n+1) * ancho int32 (la fila n es el estado muerto)
+#   aceptación mapa de bits de n+1 bits
+#   nombres    n+1 desplazamientos uint32 + texto UTF-8
+#
+# La tabla y la aceptación se usan directamente sobre el mmap, sin copiarlas,
+# así que varios procesos comparten las mismas páginas en caché.
+
+MAGIA = b"AFDB"
+VERSION = 1
+_CABECERA = struct.Struct("<4sIIIIIIIII")
+EXTENSION = ".afdb"
+
+
+def _alinear(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def _tabla_textos(textos: List[str]) -> bytes:
+    datos = [t.encode("utf-8") for t in textos]
+    desplazamientos = array("I", [0])
+    for d in datos:
+        desplazamientos.append(desplazamientos[-1] + len(d))
+    if sys.byteorder != "little":
+        desplazamientos.byteswap()
+    return desplazamientos.tobytes() + b"".join(datos)
+
+
+class _TextosMapeados(Sequence):
+    """Lista de textos decodificada bajo demanda desde el buffer"""
+
+    def __init__(self, buffer: memoryview, inicio: int, cantidad: int):
+        self._buffer = buffer
+        self._desplazamientos = _vista_enteros(buffer, inicio, cantidad + 1, "I")
+        self._datos = inicio + 4 * (cantidad + 1)
+        self._cantidad = cantidad
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._cantidad))]
+        if i < 0:
+            i += self._cantidad
+        if not 0 <= i < self._cantidad:
+            raise IndexError(i)
+        a, b = self._desplazamientos[i], self._desplazamientos[i + 1]
+        return bytes(self._buffer[self._datos + a:self._datos + b]).decode("utf-8")
+
+
+def _vista_enteros(buffer: memoryview, inicio: int, cantidad: int, tipo: str):
+    vista = buffer[inicio:inicio + 4 * cantidad]
+    if sys.byteorder == "little":
+        return vista.cast(tipo)
+    # En máquinas big-endian no hay más remedio que copiar
+    copia = array(tipo, vista.tobytes())
+    copia.byteswap()
+    return copia
+
+
+def guardar_afd_binario(afd: Union[AFD, AFDCompilado], nombre_archivo: str):
+    compilado = afd.compilar() if isinstance(afd, AFD) else afd
+    n, k = compilado.muerto, len(compilado.simbolos)
+
+    simbolos = _tabla_textos(compilado.simbolos)
+    tabla = array("i", compilado.tabla)
+    if sys.byteorder != "little":
+        tabla.byteswap()
+    tabla = tabla.tobytes()
+    aceptacion = bytes(compilado.aceptacion)
+    nombres = _tabla_textos(list(compilado.nombres))
+
+    off_simbolos = _alinear(_CABECERA.size)
+    off_tabla = _alinear(off_simbolos + len(simbolos))
+    off_aceptacion = off_tabla + len(tabla)
+    off_nombres = _alinear(off_aceptacion + len(aceptacion))
+
+    ruta = f"{nombre_archivo}{EXTENSION}"
+    with open(ruta, "wb") as f:
+        f.write(_CABECERA.pack(MAGIA, VERSION, n, k, compilado.ancho, compilado.inicial,
+                               off_simbolos, off_tabla, off_aceptacion, off_nombres))
+        for offset, datos in ((off_simbolos, simbolos), (off_tabla, tabla),
+                              (off_aceptacion, aceptacion), (off_nombres, nombres)):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(datos)
+    print(f"\n✅ AFD guardado en binario en '{ruta}'")
+
+
+def cargar_afd_binario(nombre_archivo: str, usar_mmap: bool = True) -> AFDCompilado:
+    """
+    Carga un AFD compilado. Con `usar_mmap` la tabla queda mapeada en memoria
+    (solo lectura) y los nombres de estado se decodifican solo al pedirlos.
+    """
+    ruta = f"{nombre_archivo}{EXTENSION}"
+    if not os.path.exists(ruta):
+        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
+    with open(ruta, "rb") as f:
+        if usar_mmap:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = memoryview(mapa)
+        else:
+            mapa = None
+            buffer = memoryview(f.read())
+
+    (magia, version, n, k, ancho, inicial,
+     off_simbolos, off_tabla, off_aceptacion, off_nombres) = _CABECERA.unpack_from(buffer, 0)
+    if magia != MAGIA:
+        raise ValueError(f"'{ruta}' no es un AFD binario")
+    if version != VERSION:
+        raise ValueError(f"Versión de formato no soportada: {version}")
+
+    simbolos = list(_TextosMapeados(buffer, off_simbolos, k))
+    tabla = _vista_enteros(buffer, off_tabla, (n + 1) * ancho, "i")
+    aceptacion = buffer[off_aceptacion:off_aceptacion + (n + 1 + 7) // 8]
+    nombres = _TextosMapeados(buffer, off_nombres, n)
+
+    compilado = AFDCompilado(nombres, simbolos, tabla, inicial, aceptacion)
+    # Mantiene vivo el mapeo mientras exista el autómata
+    compilado._mmap = mapa
+    return compilado
+
+
+# ============================================================
+# FORMATO COLUMNAR DE AFND (.afndc)
+# ============================================================
+#
+#   cabecera    magia "AFNC", versión, n estados, k símbolos, m transiciones,
+#               total de destinos, inicial, cantidad de finales, tamaño del
+#               alfabeto y el desplazamiento de cada sección
+#   estados     tabla de textos (n)
+#   símbolos    tabla de textos (k), puede incluir ε
+#   alfabeto    índices int32 de símbolos
+#   finales     índices int32 de estados
+#   origenes    int32[m]
+#   simbolos    int32[m]
+#   punteros    int32[m + 1] (CSR)
+#   destinos    int32[total]
+
+MAGIA_AFND = b"AFNC"
+_CABECERA_AFND = struct.Struct("<4s8I8I")
+EXTENSION_AFND = ".afndc"
+
+
+def _bytes_enteros(valores) -> bytes:
+    datos = array("i", valores)
+    if sys.byteorder != "little":
+        datos.byteswap()
+    return datos.tobytes()
+
+
+def guardar_afnd_columnar(afnd: AFND, nombre_archivo: str):
+    nombres = sorted(set(afnd.estados) | {afnd.estado_inicial}
+                     | {o for o, _ in afnd.transiciones}
+                     | {d for ds in afnd.transiciones.values() for d in ds})
+    indice = {n: i for i, n in enumerate(nombres)}
+    simbolos = sorted(set(afnd.alfabeto) | {s for _, s in afnd.transiciones})
+    indice_simbolo = {s: i for i, s in enumerate(simbolos)}
+
+    origenes, simbolos_transicion, punteros, destinos = [], [], [0], []
+    for (origen, simbolo), ds in afnd.transiciones.items():
+        origenes.append(indice[origen])
+        simbolos_transicion.append(indice_simbolo[simbolo])
+        destinos.extend(indice[d] for d in ds)
+        punteros.append(len(destinos))
+
+    secciones = [
+        _tabla_textos(nombres),
+        _tabla_textos(simbolos),
+        _bytes_enteros(indice_simbolo[s] for s in sorted(afnd.alfabeto)),
+        _bytes_enteros(indice[f] for f in sorted(afnd.estados_finales) if f in indice),
+        _bytes_enteros(origenes),
+        _bytes_enteros(simbolos_transicion),
+        _bytes_enteros(punteros),
+        _bytes_enteros(destinos),
+    ]
+    desplazamientos = []
+    posicion = _alinear(_CABECERA_AFND.size)
+    for datos in secciones:
+        desplazamientos.append(posicion)
+        posicion = _alinear(posicion + len(datos))
+
+    n_finales = len(secciones[3]) // 4
+    ruta = f"{nombre_archivo}{EXTENSION_AFND}"
+    with open(ruta, "wb") as f:
+        f.write(_CABECERA_AFND.pack(MAGIA_AFND, VERSION, len(nombres), len(simbolos),
+                                    len(origenes), len(destinos), indice[afnd.estado_inicial],
+                                    n_finales, len(afnd.alfabeto), *desplazamientos))
+        for offset, datos in zip(desplazamientos, secciones):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(datos)
+    print(f"\n✅ AFND guardado en formato columnar en '{ruta}'")
+
+
+def cargar_afnd_columnar(nombre_archivo: str,
+                         compacto: bool = False) -> Union[AFNDIndexado, AFNDCompacto]:
+    """
+    Carga un AFND columnar directamente en su representación indexada, o con
+    `compacto` en un AFNDCompacto (arreglos int32, sin máscaras por estado).
+    """
+    ruta = f"{nombre_archivo}{EXTENSION_AFND}"
+    if not os.path.exists(ruta):
+        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
+    with open(ruta, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapa)
+    try:
+        (magia, version, n, k, m, total, inicial, n_finales, n_alfabeto,
+         *offs) = _CABECERA_AFND.unpack_from(buffer, 0)
+        if magia != MAGIA_AFND:
+            raise ValueError(f"'{ruta}' no es un AFND columnar")
+        if version != VERSION:
+            raise ValueError(f"Versión de formato no soportada: {version}")
+
+        nombres = list(_TextosMapeados(buffer, offs[0], n))
+        simbolos = list(_TextosMapeados(buffer, offs[1], k))
+        alfabeto = {simbolos[i] for i in _vista_enteros(buffer, offs[2], n_alfabeto, "i")}
+        finales = list(_vista_enteros(buffer, offs[3], n_finales, "i"))
+        clase = AFNDCompacto if compacto else AFNDIndexado
+        indexado = clase.desde_arreglos(
+            nombres, simbolos, alfabeto, inicial, finales,
+            _vista_enteros(buffer, offs[4], m, "i"),
+            _vista_enteros(buffer, offs[5], m, "i"),
+            _vista_enteros(buffer, offs[6], m + 1, "i"),
+            _vista_enteros(buffer, offs[7], total, "i"),
+        )
+    finally:
+        buffer.release()
+        mapa.close()
+    print(f"\n📂 AFND cargado desde '{ruta}' correctamente")
+    return indexado
@@ -0,0 +1,337 @@
+"""
+Servicio local de evaluación de cadenas.
+
+Carga y compila una vez un registro de AFND (archivos JSON) y atiende pedidos
+por TCP en 127.0.0.1 con un protocolo de líneas JSON:
+
+    → {"id": 1, "automata": "nombre", "cadenas": ["ab", "ba"]}
+    ← {"id": 1, "resultados": [true, false]}
+
+    → {"id": 2, "op": "listar"}
+    ← {"id": 2, "automatas": {"nombre": {"estados": 4, "version": 1}}}
+
+Cada conexión puede enviar varios pedidos sin esperar respuesta (pipelining);
+las respuestas llevan el mismo "id" y pueden llegar en otro orden. Los lotes
+grandes se evalúan en un pool de procesos que abre los AFD compilados (.afdb)
+con mmap. Si un JSON cambia, el autómata se recarga sin reiniciar.
+
+Uso:
+    python src/servidor.py automata1.json [automata2.json ...] [--puerto 8765]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import signal
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from logica_automata import AFDCompilado, ConversorAFNDaAFD, cargar_afnd_desde_json
+from persistencia_binaria import EXTENSION, cargar_afd_binario, guardar_afd_binario
+
+
+# ============================================================
+# TRABAJADORES DEL POOL
+# ============================================================
+
+# nombre → (ruta .afdb, AFD compilado) ya abiertos en este proceso
+_abiertos: Dict[str, tuple] = {}
+
+
+def _evaluar_en_trabajador(nombre: str, ruta: str, cadenas: List[str]) -> List[bool]:
+    abierto = _abiertos.get(nombre)
+    if abierto is None or abierto[0] != ruta:
+        # Versión nueva del autómata: se mapea el archivo (la anterior se suelta)
+        abierto = (ruta, cargar_afd_binario(ruta[:-len(EXTENSION)]))
+        _abiertos[nombre] = abierto
+    return abierto[1].evaluar_lote(cadenas).tolist()
+
+
+def _compilar_en_trabajador(ruta_json: str, base_binaria: str):
+    """Convierte y compila el AFND y lo guarda como .afdb (fuera del bucle de eventos)"""
+    # Las funciones de carga y guardado informan por consola; aquí no hace falta
+    with contextlib.redirect_stdout(io.StringIO()):
+        afnd = cargar_afnd_desde_json(os.path.splitext(ruta_json)[0])
+        guardar_afd_binario(ConversorAFNDaAFD.convertir(afnd).compilar(), base_binaria)
+
+
+# ============================================================
+# REGISTRO DE AUTÓMATAS
+# ============================================================
+
+class EntradaRegistro:
+    def __init__(self, nombre: str, ruta_json: str):
+        self.nombre = nombre
+        self.ruta_json = ruta_json
+        self.mtime = 0.0
+        self.version = 0
+        self.compilado: Optional[AFDCompilado] = None
+        self.ruta_binaria: Optional[str] = None
+
+
+class RegistroAutomatas:
+    """
+    Autómatas servidos, por nombre (el del archivo sin .json). Cada versión se
+    compila a un .afdb en `directorio`, que el servidor y los trabajadores
+    abren con mmap. Una versión reemplazada se borra cuando ya no quedan
+    pedidos del pool que la usen.
+    """
+
+    def __init__(self, rutas: List[str], directorio: str):
+        self.directorio = directorio
+        self.entradas: Dict[str, EntradaRegistro] = {}
+        for ruta in rutas:
+            nombre = os.path.splitext(os.path.basename(ruta))[0]
+            if nombre in self.entradas:
+                raise ValueError(f"Nombre de autómata repetido: '{nombre}'")
+            self.entradas[nombre] = EntradaRegistro(nombre, ruta)
+        # ruta .afdb → pedidos del pool en curso que la usan
+        self._en_uso: Dict[str, int] = {}
+        self._retiradas: Set[str] = set()
+        self._ultima_version: Dict[str, int] = {}
+
+    def nueva_version(self, nombre: str) -> Tuple[str, float]:
+        """Base del archivo .afdb para la próxima versión y mtime actual del JSON"""
+        version = self._ultima_version.get(nombre, 0) + 1
+        self._ultima_version[nombre] = version
+        mtime = os.path.getmtime(self.entradas[nombre].ruta_json)
+        return os.path.join(self.directorio, f"{nombre}-{version}"), mtime
+
+    def registrar(self, nombre: str, base_binaria: str, mtime: float):
+        """Publica la versión ya compilada en `base_binaria`"""
+        entrada = self.entradas[nombre]
+        anterior = entrada.ruta_binaria
+        entrada.compilado = cargar_afd_binario(base_binaria)
+        entrada.ruta_binaria = base_binaria + EXTENSION
+        entrada.mtime = mtime
+        entrada.version += 1
+        if anterior:
+            self._retiradas.add(anterior)
+            self._borrar_si_libre(anterior)
+
+    def tomar(self, entrada: EntradaRegistro) -> str:
+        """Ruta de la versión actual, reservada hasta llamar a soltar()"""
+        ruta = entrada.ruta_binaria
+        self._en_uso[ruta] = self._en_uso.get(ruta, 0) + 1
+        return ruta
+
+    def soltar(self, ruta: str):
+        restantes = self._en_uso[ruta] - 1
+        if restantes:
+            self._en_uso[ruta] = restantes
+        else:
+            del self._en_uso[ruta]
+            self._borrar_si_libre(ruta)
+
+    def _borrar_si_libre(self, ruta: str):
+        if ruta in self._retiradas and ruta not in self._en_uso:
+            self._retiradas.discard(ruta)
+            # Quien ya la tenga mapeada la sigue viendo
+            with contextlib.suppress(OSError):
+                os.remove(ruta)
+
+    def cambiados(self) -> List[str]:
+        """Nombres cuyo JSON se modificó desde la última carga"""
+        resultado = []
+        for nombre, entrada in self.entradas.items():
+            try:
+                if os.path.getmtime(entrada.ruta_json) != entrada.mtime:
+                    resultado.append(nombre)
+            except OSError:
+                # Archivo borrado o a medio escribir: se conserva la versión cargada
+                pass
+        return resultado
+
+
+# ============================================================
+# SERVIDOR
+# ============================================================
+
+class ServidorEvaluacion:
+    """
+    Servidor asyncio. Los lotes de hasta `umbral_local` cadenas se evalúan en
+    el propio bucle (la ida y vuelta a otro proceso costaría más); los
+    mayores, en el pool de `trabajadores` procesos, que también hace las
+    conversiones al cargar o recargar. Cada conexión tiene como máximo
+    `max_en_vuelo` pedidos en proceso a la vez.
+    """
+
+    def __init__(self, rutas: List[str], host: str = "127.0.0.1", puerto: int = 8765,
+                 trabajadores: Optional[int] = None, umbral_local: int = 256,
+                 intervalo_recarga: float = 1.0, max_en_vuelo: int = 64):
+        self.host = host
+        self.puerto = puerto
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.umbral_local = umbral_local
+        self.intervalo_recarga = intervalo_recarga
+        self.max_en_vuelo = max_en_vuelo
+        self._directorio = tempfile.mkdtemp(prefix="automatas_")
+        self.registro = RegistroAutomatas(rutas, self._directorio)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._vigilancia: Optional[asyncio.Task] = None
+
+    async def iniciar(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.trabajadores)
+        for nombre in self.registro.entradas:
+            await self._cargar(nombre)
+            entrada = self.registro.entradas[nombre]
+            print(f"📂 '{nombre}' cargado ({entrada.compilado.muerto} estados AFD)")
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto,
+                                                    limit=1 << 26)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+        self._vigilancia = asyncio.create_task(self._vigilar())
+        print(f"✅ Servidor escuchando en {self.host}:{self.puerto}")
+
+    async def _cargar(self, nombre: str):
+        """Compila en el pool (la conversión no frena al bucle) y publica la versión"""
+        base_binaria, mtime = self.registro.nueva_version(nombre)
+        await asyncio.get_running_loop().run_in_executor(
+            self._pool, _compilar_en_trabajador, self.registro.entradas[nombre].ruta_json,
+            base_binaria)
+        self.registro.registrar(nombre, base_binaria, mtime)
+
+    async def servir(self):
+        await self.iniciar()
+        with contextlib.suppress(NotImplementedError):
+            # SIGTERM también libera el directorio temporal
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self._servidor.close)
+        try:
+            await self._servidor.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self.cerrar()
+
+    async def cerrar(self):
+        if self._vigilancia:
+            self._vigilancia.cancel()
+        if self._servidor:
+            # Sin wait_closed: esperaría a que cada cliente cierre su conexión
+            self._servidor.close()
+        if self._pool:
+            # Se cancelan los pendientes; solo se espera a los lotes ya en curso
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(self._directorio, ignore_errors=True)
+
+    async def _vigilar(self):
+        """Recarga en segundo plano los autómatas cuyo JSON cambió"""
+        while True:
+            await asyncio.sleep(self.intervalo_recarga)
+            for nombre in self.registro.cambiados():
+                try:
+                    await self._cargar(nombre)
+                    print(f"🔄 '{nombre}' recargado "
+                          f"(versión {self.registro.entradas[nombre].version})")
+                except Exception as error:
+                    # Se sigue sirviendo la versión anterior hasta el próximo cambio
+                    with contextlib.suppress(OSError):
+                        self.registro.entradas[nombre].mtime = os.path.getmtime(
+                            self.registro.entradas[nombre].ruta_json)
+                    print(f"✗ No se pudo recargar '{nombre}': {error}")
+
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        en_vuelo = asyncio.Semaphore(self.max_en_vuelo)
+        candado = asyncio.Lock()
+        tareas = set()
+
+        async def _responder(linea: bytes):
+            try:
+                try:
+                    respuesta = await self._procesar(linea)
+                except Exception as error:
+                    # Todo pedido recibe respuesta, aunque falle la evaluación
+                    respuesta = {"id": _id_de(linea), "error": f"{type(error).__name__}: {error}"}
+                async with candado:
+                    escritor.write(json.dumps(respuesta, ensure_ascii=False).encode() + b"\n")
+                    await escritor.drain()
+            except ConnectionError:
+                pass
+            finally:
+                en_vuelo.release()
+
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                await en_vuelo.acquire()
+                tarea = asyncio.create_task(_responder(linea))
+                tareas.add(tarea)
+                tarea.add_done_callback(tareas.discard)
+            if tareas:
+                await asyncio.gather(*tareas)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _procesar(self, linea: bytes) -> dict:
+        try:
+            pedido = json.loads(linea)
+        except json.JSONDecodeError as error:
+            return {"id": None, "error": f"JSON inválido: {error}"}
+        if not isinstance(pedido, dict):
+            return {"id": None, "error": "El pedido debe ser un objeto JSON"}
+        id_pedido = pedido.get("id")
+
+        if pedido.get("op") == "listar":
+            return {"id": id_pedido, "automatas": {
+                nombre: {"estados": entrada.compilado.muerto, "version": entrada.version}
+                for nombre, entrada in self.registro.entradas.items()}}
+
+        entrada = self.registro.entradas.get(pedido.get("automata"))
+        if entrada is None:
+            return {"id": id_pedido, "error": f"Autómata desconocido: {pedido.get('automata')!r}"}
+        cadenas = pedido.get("cadenas")
+        if not isinstance(cadenas, list) or not all(isinstance(c, str) for c in cadenas):
+            return {"id": id_pedido, "error": "'cadenas' debe ser una lista de textos"}
+
+        if len(cadenas) <= self.umbral_local:
+            resultados = entrada.compilado.evaluar_lote(cadenas).tolist()
+        else:
+            # La versión queda reservada hasta que el trabajador termine con ella
+            ruta = self.registro.tomar(entrada)
+            try:
+                resultados = await asyncio.get_running_loop().run_in_executor(
+                    self._pool, _evaluar_en_trabajador, entrada.nombre, ruta, cadenas)
+            finally:
+                self.registro.soltar(ruta)
+        return {"id": id_pedido, "resultados": resultados}
+
+
+def _id_de(linea: bytes):
+    """Id del pedido, si la línea es un objeto JSON válido"""
+    try:
+        pedido = json.loads(linea)
+    except ValueError:
+        return None
+    return pedido.get("id") if isinstance(pedido, dict) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio local de evaluación de cadenas")
+    parser.add_argument("automatas", nargs="+", help="archivos JSON de AFND")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--trabajadores", type=int, default=None)
+    parser.add_argument("--umbral-local", type=int, default=256,
+                        help="lotes de hasta este tamaño se evalúan sin el pool")
+    args = parser.parse_args()
+
+    servidor = ServidorEvaluacion(args.automatas, args.host, args.puerto, args.trabajadores,
+                                  args.umbral_local)
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        print("\n¡Hasta luego!")
+
+
+if __name__ == "__main__":
+    main()